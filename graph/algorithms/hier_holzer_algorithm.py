@@ -35,16 +35,14 @@ class HierHolzer:
         for vertex in self.graph.vertices:
             self.vertices[vertex] = [0, 0, 0]
             vertex_info = self.vertices[vertex]
+            out_degree = len(self.graph.out_edges(vertex))
             if not directed:
-                vertex_info[self.in_edge] = vertex_info[self.out_edge] = vertex.degree
-                edge_count += vertex.degree
+                vertex_info[self.in_edge] = vertex_info[self.out_edge] = out_degree
+                edge_count += out_degree
             else:
-                for edge in vertex.incidence:
-                    if edge.head == vertex:
-                        vertex_info[self.in_edge] += 1
-                    if edge.tail == vertex:
-                        vertex_info[self.out_edge] += 1
-                    edge_count += 1
+                vertex_info[self.in_edge] = len(self.graph.in_edges(vertex))
+                vertex_info[self.out_edge] = out_degree
+                edge_count += out_degree
                 vertex_info[self.diff] = vertex_info[self.out_edge] - vertex_info[self.in_edge]
         if directed:
             return edge_count
@@ -100,8 +98,9 @@ class HierHolzer:
 
     def hier_holzer_dfs(self, vertex):
         vertex_info = self.vertices[vertex]
+        out_edges = tuple(self.graph.out_edges(vertex))
         while vertex_info[self.out_edge] != 0:
-            neighbour = vertex.incidence[self.out_edge - 1].head
+            neighbour = out_edges[vertex_info[self.out_edge] - 1].other_end(vertex)
             vertex_info[self.out_edge] -= 1
             self.hier_holzer_dfs(neighbour)
         self.path += vertex
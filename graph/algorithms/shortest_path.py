@@ -1,19 +1,31 @@
 import math
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from graph.csr import CSRGraph, weight_array
 from heap.heap import Heap
 from graph.graph import *
+from graph.views import DirectedView, ReversedView, UndirectedView
 
 
-def edge_relaxed(edge: "Edge", directed: bool, start_v: "Vertex", min_heap: Heap = None) -> bool:
+def edge_relaxed(edge: "Edge", directed: bool, start_v: "Vertex", min_heap: Heap = None, endpoints=None) -> bool:
     # print(edge)
-    relaxed = relax_edge(edge, edge.tail, edge.head, edge.weight, start_v, min_heap)
+    tail, head = (edge.tail, edge.head) if endpoints is None else endpoints
+    relaxed = relax_edge(edge, tail, head, edge.weight, start_v, min_heap)
     if not directed:
-        relaxed = relaxed or relax_edge(edge, edge.head, edge.tail, edge.weight, start_v, min_heap)
+        relaxed = relaxed or relax_edge(edge, head, tail, edge.weight, start_v, min_heap)
     return relaxed
 
 
 def relax_edge(edge, u, v, weight, start_v, min_heap: "Heap" = None):
-    if v.label != start_v.label and u.dist + weight < v.dist:
+    if v is not start_v and u.dist + weight < v.dist:
         v.dist = u.dist + weight
         v.in_edge = edge
         if min_heap is not None:
@@ -42,12 +54,13 @@ def bellman_ford_undirected(graph: "Graph", start):
     while i < iterations and changed:
         changed = False
         for e in graph.edges:
-            if edge_relaxed(e, False, start):
+            if edge_relaxed(e, False, start, endpoints=graph.endpoints(e)):
                 changed = True
         i += 1
 
     for edge in graph.edges:
-        if edge.head.dist > edge.tail.dist + edge.weight:
+        tail, head = graph.endpoints(edge)
+        if head.dist > tail.dist + edge.weight:
             show_warning_bellman(edge)
 
 
@@ -68,15 +81,153 @@ def bellman_ford_directed(graph, start):
     while i < iterations and changed:
         changed = False
         for e in graph.edges:
-            if edge_relaxed(e, True, start):
+            if edge_relaxed(e, True, start, endpoints=graph.endpoints(e)):
                 changed = True
         i += 1
 
     for e in graph.edges:
-        if e.tail.dist + e.weight < e.head.dist:
+        tail, head = graph.endpoints(e)
+        if tail.dist + e.weight < head.dist:
             show_warning_bellman(e)
 
 
+def _parent_cycle(v: "Vertex", in_edge: Dict["Vertex", "Edge"]) -> Optional[List["Edge"]]:
+    """
+    :param v: A vertex
+    :param in_edge: The last edge of the current path to every reached vertex but the root
+    :return: The edges, in order, of the cycle reached by following the in-edges back from `v`, or `None` if they
+    lead back to the root instead
+    """
+    seen = {}
+    walk = []
+    while v not in seen:
+        seen[v] = len(walk)
+        walk.append(v)
+        edge = in_edge.get(v)
+        if edge is None:
+            return None
+        v = edge.other_end(v)
+    return [in_edge[u] for u in reversed(walk[seen[v]:])]
+
+
+def spfa(graph: "Graph", source: "Vertex") \
+        -> Tuple[Dict["Vertex", object], Dict["Vertex", "Edge"], Optional[List["Edge"]]]:
+    """
+    The queue-based Bellman-Ford algorithm (SPFA): only the out-edges of vertices whose distance changed are
+    relaxed, in first-in first-out order. Every vertex counts the edges on its current path; once that reaches the
+    number of vertices, its in-edges are followed back, and if they close a cycle the search stops right away.
+    Such a cycle always has negative weight. The vertex attributes are left alone.
+    :param graph: The graph or view, where an undirected edge of negative weight is a negative cycle by itself
+    :param source: The vertex to start from
+    :return: The distances of the reached vertices, the last edge of a shortest path to each of them but the source,
+    and the edges of a negative cycle reachable from the source, in order, or `None` if there is none. If there is a
+    negative cycle, the distances and edges are those found so far.
+    """
+    n = len(graph)
+    dist = {source: 0}
+    in_edge = {}
+    length = {source: 0}
+    queue = deque([source])
+    queued = {source}
+
+    while queue:
+        v = queue.popleft()
+        queued.discard(v)
+        d = dist[v]
+        path_length = length[v] + 1
+
+        for edge in graph.out_edges(v):
+            u = edge.other_end(v)
+            new_dist = d + edge.weight
+            if u not in dist or new_dist < dist[u]:
+                dist[u] = new_dist
+                in_edge[u] = edge
+                length[u] = path_length
+                if path_length >= n:
+                    cycle = _parent_cycle(u, in_edge)
+                    if cycle is not None:
+                        return dist, in_edge, cycle
+                if u not in queued:
+                    queued.add(u)
+                    queue.append(u)
+
+    return dist, in_edge, None
+
+
+def _arc_arrays(graph) -> Tuple[int, "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """
+    :param graph: A `CSRGraph`, a graph or a view; vertex `i` of a graph or view is `graph.vertices[i]`
+    :return: The number of vertices, and the tail, head and weight of every arc as NumPy arrays, where an undirected
+    edge gives an arc in both directions
+    """
+    if isinstance(graph, CSRGraph):
+        arrays = graph.to_numpy()
+        n = len(graph)
+        tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(arrays['offsets']))
+        return n, tails, arrays['targets'], arrays['weights']
+
+    index = {vertex: i for (i, vertex) in enumerate(graph.vertices)}
+    tails, heads, weights = [], [], []
+    for edge in graph.iter_edges():
+        tail, head = graph.endpoints(edge)
+        tails.append(index[tail])
+        heads.append(index[head])
+        weights.append(edge.weight)
+        if not graph.directed and tail is not head:
+            tails.append(index[head])
+            heads.append(index[tail])
+            weights.append(edge.weight)
+
+    weights = weight_array(weights)
+    if weights is not None:
+        weights = np.asarray(weights if type(weights) is tuple else memoryview(weights))
+    return len(index), np.array(tails, dtype=np.int64), np.array(heads, dtype=np.int64), weights
+
+
+def bellman_ford_vectorized(graph: Union["Graph", CSRGraph], source: Union["Vertex", int]):
+    """
+    The Bellman-Ford algorithm on the arc arrays of a graph, where every round relaxes all arcs at once with
+    `np.minimum.at` instead of one Python call per edge. Like `bellman_ford_directed`, it stops after the first round
+    that changes nothing. Requires NumPy.
+    :param graph: A `CSRGraph`, or a graph or view whose vertex `i` is `graph.vertices[i]`, with int or float weights
+    :param source: The vertex to start from, or its id in a `CSRGraph`
+    :return: The distance of every vertex id as a float array (`inf` if unreachable), the id of the predecessor of
+    every vertex on a shortest path (-1 for the source and unreachable vertices), and whether a negative cycle is
+    reachable from the source, in which case the distances are not shortest distances
+    """
+    if np is None:
+        raise ImportError("bellman_ford_vectorized requires NumPy")
+
+    if not isinstance(graph, CSRGraph):
+        source = graph.vertices.index(source)
+
+    n, tails, heads, weights = _arc_arrays(graph)
+    # mixed or non-numeric weights come as a tuple, and NumPy would silently turn a `None` into NaN
+    if weights is None or weights.dtype == object:
+        raise ValueError("bellman_ford_vectorized requires an int or float weight on every edge")
+    weights = weights.astype(np.float64)
+
+    dist = np.full(n, np.inf)
+    dist[source] = 0
+    predecessor = np.full(n, -1, dtype=np.int64)
+
+    for _ in range(n):
+        candidates = dist[tails] + weights
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, heads, candidates)
+        changed = new_dist < dist
+        if not changed.any():
+            return dist, predecessor, False
+
+        # an arc that gives a changed vertex its new distance is its new in-edge
+        improving = changed[heads] & (candidates == new_dist[heads])
+        predecessor[heads[improving]] = tails[improving]
+        dist = new_dist
+
+    # the n-th round still changed something, so the distances keep decreasing along a negative cycle
+    return dist, predecessor, True
+
+
 def find_min(vertices: list["Vertex"]) -> "Vertex":
     v_to_return = vertices[0]
     min_dist = v_to_return.dist
@@ -94,6 +245,400 @@ def show_warning_dijkstra(edge):
         '\033[0m')
 
 
+def dijkstra(graph: "Graph", source: "Vertex", targets: Union["Vertex", Iterable["Vertex"]] = None,
+             cutoff=None) -> Tuple[Dict["Vertex", object], Dict["Vertex", "Edge"]]:
+    """
+    Dijkstra's algorithm with a binary heap and lazy deletion: vertices are pushed only when they are discovered,
+    and pushed again when their distance improves, and stale heap entries are skipped when popped. The search stops
+    as soon as every target is settled, and never goes beyond the cutoff, so it only looks at the part of the graph
+    it needs. The edges leaving a vertex are `graph.out_edges(vertex)`, so an undirected graph is searched along
+    every incident edge. The vertex attributes are left alone.
+    :param graph: The graph or view, with non-negative edge weights
+    :param source: The vertex to start from
+    :param targets: Optional vertex or vertices to stop at, once they are all settled
+    :param cutoff: Optional largest distance to search up to
+    :return: The distances of the settled vertices, and the last edge of a shortest path to each settled vertex
+    but the source
+    """
+    if targets is None:
+        remaining = None
+    elif isinstance(targets, Vertex):
+        remaining = {targets}
+    else:
+        remaining = set(targets)
+
+    dist = {source: 0}
+    in_edge = {}
+    settled = {}
+    tie_breaker = count()
+    min_heap = [(0, next(tie_breaker), source)]
+    warned = False
+
+    while min_heap:
+        d, _, v = heappop(min_heap)
+        if v in settled:
+            continue
+        settled[v] = d
+
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
+
+        for edge in graph.out_edges(v):
+            u = edge.other_end(v)
+            if u in settled:
+                continue
+            weight = edge.weight
+            if weight < 0 and not warned:
+                show_warning_dijkstra(edge)
+                warned = True
+            new_dist = d + weight
+            if cutoff is not None and new_dist > cutoff:
+                continue
+            if u not in dist or new_dist < dist[u]:
+                dist[u] = new_dist
+                in_edge[u] = edge
+                heappush(min_heap, (new_dist, next(tie_breaker), u))
+
+    return settled, {v: in_edge[v] for v in settled if v in in_edge}
+
+
+def dijkstra_csr(csr: CSRGraph, source: int, targets: Union[int, Iterable[int]] = None,
+                 cutoff=None) -> Tuple[List[object], List[int]]:
+    """
+    `dijkstra` on a `CSRGraph`, walking the arcs of every vertex straight from its offsets and targets, without any
+    `Vertex` or `Edge` objects. Safe to run on a shared snapshot from several threads at once, see
+    `ConcurrentGraph.snapshot`.
+    :param csr: The snapshot, with non-negative weights
+    :param source: The vertex id to start from
+    :param targets: Optional vertex id or ids to stop at, once they are all settled
+    :param cutoff: Optional largest distance to search up to
+    :return: The distance of every vertex id (`math.inf` if it was not settled), and the id of its predecessor on a
+    shortest path (-1 for the source and vertices that were not settled)
+    """
+    weights = csr.weights
+    if weights is None:
+        raise ValueError("dijkstra_csr requires edge weights; use bfs_csr for unweighted graphs")
+
+    if targets is None:
+        remaining = None
+    elif isinstance(targets, int):
+        remaining = {targets}
+    else:
+        remaining = set(targets)
+
+    offsets, heads = csr.offsets, csr.targets
+    n = len(csr)
+    dist = [math.inf] * n
+    predecessor = [-1] * n
+    settled = bytearray(n)
+    dist[source] = 0
+    # vertex ids are ints, so heap entries with the same distance never need a tie breaker
+    min_heap = [(0, source)]
+
+    while min_heap:
+        d, v = heappop(min_heap)
+        if settled[v]:
+            continue
+        settled[v] = 1
+
+        if remaining is not None:
+            remaining.discard(v)
+            if not remaining:
+                break
+
+        for arc in range(offsets[v], offsets[v + 1]):
+            u = heads[arc]
+            if settled[u]:
+                continue
+            new_dist = d + weights[arc]
+            if cutoff is not None and new_dist > cutoff:
+                continue
+            if new_dist < dist[u]:
+                dist[u] = new_dist
+                predecessor[u] = v
+                heappush(min_heap, (new_dist, u))
+
+    if min_heap:
+        # stopped early: forget the tentative distances of the vertices that were not settled
+        for v in range(n):
+            if not settled[v]:
+                dist[v] = math.inf
+                predecessor[v] = -1
+
+    return dist, predecessor
+
+
+def bfs_csr(csr: CSRGraph, source: int) -> Tuple[List[int], List[int]]:
+    """
+    Breadth-first search on a `CSRGraph`, ignoring the weights.
+    :param csr: The snapshot
+    :param source: The vertex id to start from
+    :return: The number of arcs on a shortest path to every vertex id (-1 if unreachable), and the id of its
+    predecessor on such a path (-1 for the source and unreachable vertices)
+    """
+    offsets, heads = csr.offsets, csr.targets
+    n = len(csr)
+    hops = [-1] * n
+    predecessor = [-1] * n
+    hops[source] = 0
+    frontier = [source]
+
+    while frontier:
+        next_frontier = []
+        for v in frontier:
+            h = hops[v] + 1
+            for u in heads[offsets[v]:offsets[v + 1]]:
+                if hops[u] < 0:
+                    hops[u] = h
+                    predecessor[u] = v
+                    next_frontier.append(u)
+        frontier = next_frontier
+
+    return hops, predecessor
+
+
+def _path_to(root: "Vertex", v: "Vertex", in_edge: Dict["Vertex", "Edge"]) -> List["Vertex"]:
+    """
+    :param root: The vertex a search started from
+    :param v: A vertex the search reached
+    :param in_edge: The last edge of a shortest path to every reached vertex but the root
+    :return: The vertices of the shortest path from `v` back to `root`
+    """
+    path = [v]
+    while v is not root:
+        v = in_edge[v].other_end(v)
+        path.append(v)
+    return path
+
+
+def bidirectional_dijkstra(graph: "Graph", source: "Vertex", target: "Vertex") -> Tuple[object, List["Vertex"]]:
+    """
+    Dijkstra's algorithm from both ends at once: forward from `source` along `graph.out_edges`, and backward from
+    `target` along `graph.in_edges`, always expanding the side whose next vertex is closest. The search stops as soon
+    as no path through the unsettled vertices can beat the best path found where the two searches met.
+    :param graph: The graph or view, with non-negative edge weights
+    :param source: The vertex to start from
+    :param target: The vertex to reach
+    :return: The distance from `source` to `target` and the vertices of a shortest path, or `math.inf` and an empty
+    list if there is no path
+    """
+    if source is target:
+        return 0, [source]
+
+    dists = ({source: 0}, {target: 0})
+    in_edges = ({}, {})
+    settled = (set(), set())
+    tie_breaker = count()
+    heaps = ([(0, next(tie_breaker), source)], [(0, next(tie_breaker), target)])
+    incident = (graph.out_edges, graph.in_edges)
+    best, meeting = math.inf, None
+    warned = False
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, _, v = heappop(heaps[side])
+        if v in settled[side]:
+            continue
+        settled[side].add(v)
+
+        dist, other_dist = dists[side], dists[1 - side]
+        for edge in incident[side](v):
+            u = edge.other_end(v)
+            if u in settled[side]:
+                continue
+            weight = edge.weight
+            if weight < 0 and not warned:
+                show_warning_dijkstra(edge)
+                warned = True
+            new_dist = d + weight
+            if u not in dist or new_dist < dist[u]:
+                dist[u] = new_dist
+                in_edges[side][u] = edge
+                heappush(heaps[side], (new_dist, next(tie_breaker), u))
+                if u in other_dist and new_dist + other_dist[u] < best:
+                    best, meeting = new_dist + other_dist[u], u
+
+    if meeting is None:
+        return math.inf, []
+
+    forward = _path_to(source, meeting, in_edges[0])
+    backward = _path_to(target, meeting, in_edges[1])
+    return best, forward[::-1] + backward[1:]
+
+
+def astar(graph: "Graph", source: "Vertex", target: "Vertex",
+          heuristic: Callable[["Vertex", "Vertex"], object]) -> Tuple[object, List["Vertex"]]:
+    """
+    The A* search: Dijkstra's algorithm where a vertex is popped in order of its distance plus the estimated
+    distance left to the target, so that the search heads towards the target. With a heuristic that never
+    overestimates, the path found is a shortest path; a vertex whose estimate is `math.inf` is never pushed.
+    :param graph: The graph or view, with non-negative edge weights
+    :param source: The vertex to start from
+    :param target: The vertex to reach
+    :param heuristic: A function `heuristic(v, target)` estimating the distance from `v` to `target`, such as
+    `euclidean_distance`, `manhattan_distance`, `haversine_distance` or a `LandmarkHeuristic`
+    :return: The distance from `source` to `target` and the vertices of a shortest path, or `math.inf` and an empty
+    list if there is no path
+    """
+    dist = {source: 0}
+    in_edge = {}
+    tie_breaker = count()
+    min_heap = [(heuristic(source, target), next(tie_breaker), 0, source)]
+    warned = False
+
+    while min_heap:
+        _, _, d, v = heappop(min_heap)
+        if d > dist[v]:
+            continue
+        if v is target:
+            return d, _path_to(source, target, in_edge)[::-1]
+
+        for edge in graph.out_edges(v):
+            u = edge.other_end(v)
+            weight = edge.weight
+            if weight < 0 and not warned:
+                show_warning_dijkstra(edge)
+                warned = True
+            new_dist = d + weight
+            if u not in dist or new_dist < dist[u]:
+                estimate = heuristic(u, target)
+                if estimate == math.inf:
+                    continue
+                dist[u] = new_dist
+                in_edge[u] = edge
+                heappush(min_heap, (new_dist + estimate, next(tie_breaker), new_dist, u))
+
+    return math.inf, []
+
+
+def euclidean_distance(u: "Vertex", v: "Vertex") -> float:
+    """
+    :param u: A vertex with coordinates in its attribute `pos`
+    :param v: Another vertex with coordinates in its attribute `pos`
+    :return: The straight-line distance between the vertices
+    """
+    return math.dist(u.pos, v.pos)
+
+
+def manhattan_distance(u: "Vertex", v: "Vertex"):
+    """
+    :param u: A vertex with coordinates in its attribute `pos`
+    :param v: Another vertex with coordinates in its attribute `pos`
+    :return: The sum of the absolute differences of the coordinates of the vertices
+    """
+    return sum(abs(a - b) for (a, b) in zip(u.pos, v.pos))
+
+
+# the mean radius of the earth in kilometres
+EARTH_RADIUS = 6371.0088
+
+
+def haversine_distance(u: "Vertex", v: "Vertex") -> float:
+    """
+    :param u: A vertex with `(latitude, longitude)` in degrees in its attribute `pos`
+    :param v: Another vertex with `(latitude, longitude)` in degrees in its attribute `pos`
+    :return: The great-circle distance between the vertices in kilometres
+    """
+    lat_u, lon_u = map(math.radians, u.pos)
+    lat_v, lon_v = map(math.radians, v.pos)
+    a = math.sin((lat_v - lat_u) / 2) ** 2 + math.cos(lat_u) * math.cos(lat_v) * math.sin((lon_v - lon_u) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(min(1.0, math.sqrt(a)))
+
+
+class LandmarkHeuristic(object):
+    """
+    The ALT heuristic for `astar`: the distances from and to a few landmark vertices are computed once, and by the
+    triangle inequality they bound the distance between any two vertices from below. Works for any graph with
+    non-negative edge weights, without coordinates. The tables go stale when the graph changes.
+    """
+
+    def __init__(self, graph: "Graph", landmarks: Union[int, Iterable["Vertex"]] = 8):
+        """
+        Computes the landmark distance tables, with two Dijkstra searches per landmark in a directed graph and one
+        in an undirected graph
+        :param graph: The graph or view
+        :param landmarks: The landmark vertices, or how many to choose. They are then chosen greedily, each as far
+        as possible from the ones before
+        """
+        self._from = []
+        if isinstance(landmarks, int):
+            self._landmarks = self.__choose_landmarks(graph, landmarks)
+        else:
+            self._landmarks = list(landmarks)
+            self._from = [dijkstra(graph, landmark)[0] for landmark in self._landmarks]
+
+        if graph.directed:
+            reversed_graph = ReversedView(graph)
+            self._to = [dijkstra(reversed_graph, landmark)[0] for landmark in self._landmarks]
+        else:
+            self._to = self._from
+
+    def __choose_landmarks(self, graph: "Graph", k: int) -> List["Vertex"]:
+        vertices = graph.vertices
+        if not vertices or k <= 0:
+            return []
+
+        far = dijkstra(graph, vertices[0])[0]
+        candidate = max(far, key=far.get)
+        landmarks = []
+        # the distance from the nearest landmark, infinite for the vertices no landmark reaches
+        nearest = dict.fromkeys(vertices, math.inf)
+
+        while len(landmarks) < k:
+            landmarks.append(candidate)
+            dist = dijkstra(graph, candidate)[0]
+            self._from.append(dist)
+            for v, d in dist.items():
+                if d < nearest[v]:
+                    nearest[v] = d
+            candidate = max(nearest, key=nearest.get)
+            if nearest[candidate] == 0:
+                break
+
+        return landmarks
+
+    @property
+    def landmarks(self) -> List["Vertex"]:
+        """
+        :return: The landmark vertices
+        """
+        return self._landmarks
+
+    def __call__(self, v: "Vertex", target: "Vertex"):
+        """
+        :param v: A vertex
+        :param target: The target vertex
+        :return: A lower bound on the distance from `v` to `target`, or `math.inf` if a landmark shows that there
+        is no path
+        """
+        bound = 0
+        for dist_from, dist_to in zip(self._from, self._to):
+            if v in dist_from:
+                if target not in dist_from:
+                    # the landmark reaches v but not the target, so v does not reach it either
+                    return math.inf
+                bound = max(bound, dist_from[target] - dist_from[v])
+            if target in dist_to:
+                if v not in dist_to:
+                    # the target reaches the landmark but v does not, so v can not reach the target
+                    return math.inf
+                bound = max(bound, dist_to[v] - dist_to[target])
+        return bound
+
+
+def _store_search(graph: "Graph", start: "Vertex", dist: Dict["Vertex", object], in_edge: Dict["Vertex", "Edge"]):
+    init_search(graph, start)
+    for v, d in dist.items():
+        v.dist = d
+    for v, edge in in_edge.items():
+        v.in_edge = edge
+
+
 def dijkstra_undirected(graph: "Graph", start: "Vertex"):
     """
     Arguments: <graph> is a graph object, where edges have integer <weight>
@@ -104,20 +649,8 @@ def dijkstra_undirected(graph: "Graph", start: "Vertex"):
         shortest path edge, for every reachable vertex except <start>.
         <graph> is viewed as an undirected graph.
     """
-    # Initialize the vertex attributes:
-    init_search(graph, start)
-    min_heap = Heap(len(graph.vertices))
-
-    for vertica in graph.vertices:
-        min_heap += vertica
-
-    while min_heap:
-        # print(min_heap.count)
-        v = min_heap.pop()
-        for edge in v.incidence:
-            if edge.weight < 0:
-                show_warning_dijkstra(edge)
-            edge_relaxed(edge, False, start, min_heap)
+    view = UndirectedView(graph) if graph.directed else graph
+    _store_search(graph, start, *dijkstra(view, start))
 
 
 def dijkstra_directed(graph, start):
@@ -130,24 +663,8 @@ def dijkstra_directed(graph, start):
         shortest path edge, for every reachable vertex except <start>.
         <graph> is viewed as a directed graph.
     """
-    # Initialize the vertex attributes:
-    init_search(graph, start)
-    min_heap = Heap(len(graph.vertices))
-
-    for vertica in graph.vertices:
-        min_heap += vertica
-
-    # print(min_heap, len(min_heap))
-    while min_heap:
-        v = min_heap.pop()
-        # print(f"Just popped: {v, v.dist}")
-        # print(len(min_heap), min_heap)
-        for edge in filter(lambda e: e.tail == v, v.incidence):
-            if edge.weight < 0:
-                show_warning_dijkstra(edge)
-            # print(f"Before:{edge, edge.tail.dist, edge.head.dist, edge.weight}")
-            edge_relaxed(edge, True, start, min_heap)
-            # print(f"After: {edge, edge.tail.dist, edge.head.dist, edge.weight}")
+    view = graph if graph.directed else DirectedView(graph)
+    _store_search(graph, start, *dijkstra(view, start))
 
 
 def init_search(graph: "Graph", start: "Vertex"):
@@ -12,7 +12,7 @@ class Tarjan:
     num = 0
 
     @classmethod
-    def __find_strongly_connected(cls, vertex, stack, vertices, scc_s) -> None:
+    def __find_strongly_connected(cls, graph, vertex, stack, vertices, scc_s) -> None:
         # print(vertex, vertices, stack)
         stack += vertex
         vertex_info = vertices.get(vertex)
@@ -21,12 +21,12 @@ class Tarjan:
         # print(vertex_info)
         cls.num += 1
 
-        for edge in filter(lambda e: e.head.label != vertex.label, vertex.incidence):
-            neighbour = edge.head
+        for edge in graph.out_edges(vertex):
+            neighbour = edge.other_end(vertex)
             # print(f"{vertex} -> {neighbour}")
             neighbour_info = vertices.get(neighbour)
             if not neighbour_info[cls.visited]:
-                cls.__find_strongly_connected(neighbour, stack, vertices, scc_s)
+                cls.__find_strongly_connected(graph, neighbour, stack, vertices, scc_s)
                 vertex_info[cls.low_link] = min(neighbour_info[cls.low_link], vertex_info[cls.low_link])
                 # print(vertex_info)
             else:
@@ -54,7 +54,7 @@ class Tarjan:
         list_of_sccs = []
         for vertex in vertices:
             if not vertices.get(vertex)[cls.visited] and not vertices.get(vertex)[cls.found_scc]:
-                cls.__find_strongly_connected(vertex, stack, vertices, list_of_sccs)
+                cls.__find_strongly_connected(g, vertex, stack, vertices, list_of_sccs)
         return list_of_sccs
 
 
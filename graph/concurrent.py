@@ -0,0 +1,156 @@
+"""
+A thread-safe wrapper around a `Graph`, for serving queries from many threads while another thread applies updates.
+"""
+import threading
+from contextlib import contextmanager
+
+from graph.csr import CSRGraph
+from graph.graph import Graph
+
+
+class ReadWriteLock(object):
+    """
+    A lock that is held either by any number of readers or by a single writer. Waiting writers take precedence over
+    new readers, so a steady stream of queries can not starve the updates. The read side is reentrant: a thread that
+    holds the lock, as a reader or as the writer, may take it for reading again without waiting. A reader may not
+    take the lock for writing.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        # the number of read holds of the current thread
+        self._local = threading.local()
+
+    def acquire_read(self):
+        reads = getattr(self._local, 'reads', 0)
+        with self._condition:
+            if reads == 0 and self._writer is not threading.current_thread():
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+        self._local.reads = reads + 1
+
+    def release_read(self):
+        self._local.reads -= 1
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        if getattr(self._local, 'reads', 0):
+            raise RuntimeError("Can not take the lock for writing while holding it for reading")
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = threading.current_thread()
+
+    def release_write(self):
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """
+        Holds the lock as a reader for the duration of a `with` block
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        Holds the lock as the writer for the duration of a `with` block
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentGraph(object):
+    """
+    Guards a `Graph` with a `ReadWriteLock`. Readers traverse the graph in parallel inside `read()` blocks, and a writer
+    applies a batch of changes inside a single `write()` block, so readers never see half of a batch.
+
+    Searches that return their results, such as `dijkstra`, `bidirectional_dijkstra`, `astar` and `spfa` in
+    `graph.algorithms.shortest_path`, may run on the shared graph inside a `read()` block. Algorithms that store
+    their results on the vertices, such as `dijkstra_directed` and `bellman_ford_directed` with `dist` and
+    `in_edge`, must not run on the shared graph from several threads; run them on a private `copy()` instead. Queries
+    on vertex ids can also run on the immutable `snapshot()` without holding the lock, with `dijkstra_csr`,
+    `bfs_csr` and `bellman_ford_vectorized`. `snapshot()` and `copy()` may also be called inside `read()` and
+    `write()` blocks, but `write()` may not be entered inside a `read()` block.
+    """
+
+    def __init__(self, graph: Graph = None):
+        """
+        Wraps a graph. The graph should not be used directly anymore.
+        :param graph: The graph, or `None` for a new empty undirected graph
+        """
+        self._graph = Graph() if graph is None else graph
+        self._lock = ReadWriteLock()
+        self._snapshot = None
+        self._snapshot_lock = threading.Lock()
+
+    def __repr__(self):
+        """
+        A programmer-friendly representation of the concurrent graph.
+        :return: The string to approximate the constructor arguments of the `ConcurrentGraph'
+        """
+        return 'ConcurrentGraph(graph={!r})'.format(self._graph)
+
+    @property
+    def version(self) -> int:
+        """
+        :return: The `Graph.version` of the wrapped graph
+        """
+        return self._graph.version
+
+    @contextmanager
+    def read(self):
+        """
+        Gives read-only access to the graph for the duration of a `with` block, in parallel with other readers.
+        """
+        with self._lock.read():
+            yield self._graph
+
+    @contextmanager
+    def write(self):
+        """
+        Gives exclusive access to the graph for the duration of a `with` block, to apply a batch of changes.
+        """
+        with self._lock.write():
+            yield self._graph
+
+    def snapshot(self) -> CSRGraph:
+        """
+        An immutable CSR snapshot of the graph, which later writes do not affect. Snapshots are shared between
+        readers and only taken again after the graph has changed.
+        :return: The snapshot of the current version
+        """
+        with self._lock.read():
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version != self._graph.version:
+                snapshot = self._graph.freeze()
+                with self._snapshot_lock:
+                    if self._snapshot is None or self._snapshot.version < snapshot.version:
+                        self._snapshot = snapshot
+            return snapshot
+
+    def copy(self) -> Graph:
+        """
+        A private, mutable copy of the graph, on which any algorithm may run.
+        :return: The copy
+        """
+        with self._lock.read():
+            return Graph.copy(self._graph)
@@ -0,0 +1,246 @@
+"""
+An immutable compressed-sparse-row (CSR) representation of a graph, meant for read-only algorithm runs.
+"""
+from array import array
+from typing import Iterator, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def weight_array(weights: Sequence):
+    """
+    Packs a sequence of edge weights into the most compact container that can hold them.
+    :param weights: The weights, one per arc
+    :return: `None` if every weight is `None`, an `array` of type 'q' or 'd' if every weight is an int or a float,
+    and a tuple of the weights otherwise. Without any weights, an empty `array` of type 'q'
+    """
+    if len(weights) == 0:
+        return array('q')
+    if all(w is None for w in weights):
+        return None
+    if all(type(w) is int for w in weights):
+        try:
+            return array('q', weights)
+        except OverflowError:
+            return tuple(weights)
+    if all(type(w) in (int, float) for w in weights):
+        return array('d', weights)
+    return tuple(weights)
+
+
+class CSRGraph(object):
+    """
+    A frozen snapshot of a `Graph`. Vertices are the integers `0..n-1`, in the order of `Graph.vertices`, and the
+    arcs leaving vertex `i` are stored contiguously in `targets[offsets[i]:offsets[i + 1]]`, with their weights at
+    the same positions of `weights`. An undirected edge is stored as an arc in both directions, a loop only once.
+    """
+
+    __slots__ = ('_directed', '_labels', '_offsets', '_targets', '_weights', '_edge_ids', '_n_edges', '_version')
+
+    def __init__(self, directed: bool, labels: Sequence, offsets, targets, weights=None, edge_ids=None,
+                 n_edges: Optional[int] = None, version: Optional[int] = None):
+        """
+        Creates a CSR graph from its arrays. Use `Graph.freeze` or `CSRGraph.from_arcs` rather than calling this.
+        :param directed: Whether the arcs are directed
+        :param labels: The labels of the vertices, indexed by vertex id
+        :param offsets: `n + 1` offsets into `targets`
+        :param targets: The head of every arc
+        :param weights: Optional weight of every arc, see `weight_array`
+        :param edge_ids: Optional index of the original edge of every arc
+        :param n_edges: The number of edges the arcs were derived from
+        :param version: The `Graph.version` of the graph the snapshot was taken from, if any
+        """
+        if len(offsets) != len(labels) + 1 or offsets[-1] != len(targets):
+            raise ValueError("The offsets do not match the number of vertices and arcs")
+        if weights is not None and len(weights) != len(targets):
+            raise ValueError("There must be exactly one weight for every arc")
+
+        self._directed = directed
+        self._labels = labels
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._edge_ids = edge_ids
+        self._n_edges = len(targets) if n_edges is None else n_edges
+        self._version = version
+
+    @classmethod
+    def from_arcs(cls, n: int, tails: Sequence[int], heads: Sequence[int], weights: Sequence = None,
+                  directed: bool = True, labels: Sequence = None, edge_ids: Sequence[int] = None,
+                  n_edges: Optional[int] = None, version: Optional[int] = None) -> "CSRGraph":
+        """
+        Builds a CSR graph from parallel arc arrays with a counting sort, in O(n + m).
+        :param n: The number of vertices
+        :param tails: The tail of every arc
+        :param heads: The head of every arc
+        :param weights: Optional weight of every arc
+        :param directed: Whether the arcs are directed
+        :param labels: Optional vertex labels, defaults to the vertex ids
+        :param edge_ids: Optional index of the original edge of every arc
+        :param n_edges: The number of edges the arcs were derived from
+        :param version: The `Graph.version` of the graph the snapshot was taken from, if any
+        :return: The CSR graph
+        """
+        offsets = array('q', bytes(8 * (n + 1)))
+        for tail in tails:
+            offsets[tail + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        position = array('q', offsets[:-1])
+        order = array('q', bytes(8 * len(tails)))
+        for arc, tail in enumerate(tails):
+            order[position[tail]] = arc
+            position[tail] += 1
+
+        targets = array('q', (heads[arc] for arc in order))
+        if weights is not None:
+            weights = weight_array([weights[arc] for arc in order])
+        if edge_ids is not None:
+            edge_ids = array('q', (edge_ids[arc] for arc in order))
+
+        return cls(directed, range(n) if labels is None else labels, offsets, targets, weights, edge_ids, n_edges,
+                   version)
+
+    def __repr__(self):
+        """
+        A programmer-friendly representation of the CSR graph.
+        :return: The string to approximate the constructor arguments of the `CSRGraph'
+        """
+        return 'CSRGraph(directed={}, #arcs={}, #vertices={})'.format(self._directed, len(self._targets),
+                                                                     len(self._labels))
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the graph
+        """
+        return len(self._labels)
+
+    @property
+    def directed(self) -> bool:
+        """
+        :return: Whether the graph is directed
+        """
+        return self._directed
+
+    @property
+    def labels(self) -> Sequence:
+        """
+        :return: The labels of the vertices, indexed by vertex id
+        """
+        return self._labels
+
+    @property
+    def n_edges(self) -> int:
+        """
+        :return: The number of edges of the graph this snapshot was taken from
+        """
+        return self._n_edges
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        :return: The `Graph.version` of the graph this snapshot was taken from, if any
+        """
+        return self._version
+
+    @property
+    def offsets(self) -> memoryview:
+        """
+        :return: A read-only view of the `n + 1` arc offsets
+        """
+        return memoryview(self._offsets).toreadonly()
+
+    @property
+    def targets(self) -> memoryview:
+        """
+        :return: A read-only view of the arc heads
+        """
+        return memoryview(self._targets).toreadonly()
+
+    @property
+    def weights(self):
+        """
+        :return: A read-only view of the arc weights, a tuple if they are not all numbers, or `None` if unweighted
+        """
+        if self._weights is None or type(self._weights) is tuple:
+            return self._weights
+        return memoryview(self._weights).toreadonly()
+
+    @property
+    def edge_ids(self) -> Optional[memoryview]:
+        """
+        :return: A read-only view of the index in `Graph.edges` of the edge every arc came from, if known
+        """
+        if self._edge_ids is None:
+            return None
+        return memoryview(self._edge_ids).toreadonly()
+
+    def out_degree(self, i: int) -> int:
+        """
+        :param i: A vertex id
+        :return: The number of arcs leaving vertex `i`
+        """
+        return self._offsets[i + 1] - self._offsets[i]
+
+    def neighbours(self, i: int) -> memoryview:
+        """
+        :param i: A vertex id
+        :return: The heads of the arcs leaving vertex `i`
+        """
+        return self.targets[self._offsets[i]:self._offsets[i + 1]]
+
+    def arcs(self, i: int) -> Iterator[Tuple[int, object]]:
+        """
+        :param i: A vertex id
+        :return: An iterator over `(head, weight)` of the arcs leaving vertex `i`
+        """
+        start, end = self._offsets[i], self._offsets[i + 1]
+        if self._weights is None:
+            return ((self._targets[k], None) for k in range(start, end))
+        return zip(self._targets[start:end], self._weights[start:end])
+
+    def arc_arrays(self) -> Tuple[array, memoryview, object]:
+        """
+        Expands the offsets into an explicit tail for every arc.
+        :return: The parallel `(tails, heads, weights)` arrays of all arcs
+        """
+        tails = array('q')
+        offsets = self._offsets
+        for i in range(len(self._labels)):
+            tails.extend([i] * (offsets[i + 1] - offsets[i]))
+        return tails, self.targets, self.weights
+
+    def transpose(self) -> "CSRGraph":
+        """
+        Reverses every arc, so that the arcs leaving a vertex are the arcs that entered it. For an undirected graph
+        this is the graph itself.
+        :return: The transposed graph
+        """
+        if not self._directed:
+            return self
+        tails, heads, weights = self.arc_arrays()
+        return CSRGraph.from_arcs(len(self._labels), heads, tails, weights, True, self._labels, self._edge_ids,
+                                  self._n_edges, self._version)
+
+    def to_numpy(self) -> dict:
+        """
+        Converts the arrays to read-only NumPy arrays, without copying them when possible. Requires NumPy.
+        :return: A dict with the keys 'offsets', 'targets' and 'weights'
+        """
+        if np is None:
+            raise ImportError("CSRGraph.to_numpy requires NumPy")
+
+        # built on the read-only views, so that the arrays can not change the snapshot
+        weights = self.weights
+        if weights is not None:
+            weights = np.asarray(weights)
+            weights.flags.writeable = False
+        return {
+            'offsets': np.frombuffer(self.offsets, dtype=np.int64),
+            'targets': np.frombuffer(self.targets, dtype=np.int64),
+            'weights': weights,
+        }
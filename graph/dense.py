@@ -0,0 +1,212 @@
+"""
+A dense adjacency representation of a simple graph, where every vertex keeps its row of the adjacency matrix as a
+bitset in a Python integer. Set operations between graphs then work on whole machine words at a time.
+"""
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+def _bits(row: int) -> Iterator[int]:
+    """
+    :param row: A bitset
+    :return: An iterator over the positions of the set bits, in increasing order
+    """
+    while row:
+        low = row & -row
+        yield low.bit_length() - 1
+        row ^= low
+
+
+class BitsetGraph(object):
+    """
+    A graph on the vertices `0..n-1`, where bit `j` of `rows[i]` is set iff there is an edge from `i` to `j`. The rows
+    of an undirected graph are kept symmetric. Multi-edges collapse into a single edge.
+    """
+
+    __slots__ = ('_n', '_directed', '_rows', '_labels')
+
+    def __init__(self, n: int, directed: bool = False, rows: Optional[List[int]] = None, labels: Sequence = None):
+        """
+        Creates a dense graph
+        :param n: The number of vertices
+        :param directed: Whether the graph is directed
+        :param rows: Optional adjacency rows, which are used without copying. Defaults to no edges
+        :param labels: Optional labels of the vertices, indexed by vertex id
+        """
+        if rows is not None and len(rows) != n:
+            raise ValueError("There must be exactly one row for every vertex")
+
+        self._n = n
+        self._directed = directed
+        self._rows = [0] * n if rows is None else rows
+        self._labels = labels
+
+    @classmethod
+    def from_graph(cls, graph) -> "BitsetGraph":
+        """
+        Creates the dense form of a graph. Vertex `i` is `graph.vertices[i]`.
+        :param graph: The graph
+        :return: The dense graph
+        """
+        index = {vertex: i for (i, vertex) in enumerate(graph.vertices)}
+        rows = [0] * len(index)
+        directed = graph.directed
+
+        for edge in graph.edges:
+            tail, head = index[edge.tail], index[edge.head]
+            rows[tail] |= 1 << head
+            if not directed:
+                rows[head] |= 1 << tail
+
+        return cls(len(rows), directed, rows, [vertex.label for vertex in index])
+
+    def __repr__(self):
+        """
+        A programmer-friendly representation of the dense graph.
+        :return: The string to approximate the constructor arguments of the `BitsetGraph'
+        """
+        return 'BitsetGraph(directed={}, #edges={}, #vertices={})'.format(self._directed, self.n_edges, self._n)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the graph
+        """
+        return self._n
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BitsetGraph) and self._directed == other._directed and self._rows == other._rows
+
+    __hash__ = None
+
+    @property
+    def directed(self) -> bool:
+        """
+        :return: Whether the graph is directed
+        """
+        return self._directed
+
+    @property
+    def labels(self) -> Optional[Sequence]:
+        """
+        :return: The labels of the vertices, if known
+        """
+        return self._labels
+
+    @property
+    def rows(self) -> Tuple[int, ...]:
+        """
+        :return: The adjacency rows
+        """
+        return tuple(self._rows)
+
+    @property
+    def n_edges(self) -> int:
+        """
+        :return: The number of edges, where a loop counts once
+        """
+        arcs = sum(bin(row).count('1') for row in self._rows)
+        if self._directed:
+            return arcs
+        loops = sum((row >> i) & 1 for (i, row) in enumerate(self._rows))
+        return (arcs + loops) // 2
+
+    def is_adjacent(self, u: int, v: int) -> bool:
+        """
+        :param u: One vertex
+        :param v: The other vertex
+        :return: Whether there is an edge from `u` to `v`
+        """
+        return (self._rows[u] >> v) & 1 == 1
+
+    def add_edge(self, u: int, v: int):
+        """
+        Adds the edge from `u` to `v`, if it is not there yet
+        :param u: One vertex
+        :param v: The other vertex
+        """
+        self._rows[u] |= 1 << v
+        if not self._directed:
+            self._rows[v] |= 1 << u
+
+    def remove_edge(self, u: int, v: int):
+        """
+        Removes the edge from `u` to `v`, if it is there
+        :param u: One vertex
+        :param v: The other vertex
+        """
+        self._rows[u] &= ~(1 << v)
+        if not self._directed:
+            self._rows[v] &= ~(1 << u)
+
+    def neighbours(self, u: int) -> List[int]:
+        """
+        :param u: A vertex
+        :return: The heads of the edges leaving `u`, in increasing order
+        """
+        return list(_bits(self._rows[u]))
+
+    def degree(self, u: int) -> int:
+        """
+        :param u: A vertex
+        :return: The number of edges leaving `u`
+        """
+        return bin(self._rows[u]).count('1')
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        """
+        :return: An iterator over the edges as `(tail, head)`, every undirected edge once with `tail <= head`
+        """
+        for (u, row) in enumerate(self._rows):
+            if not self._directed:
+                row = (row >> u) << u
+            for v in _bits(row):
+                yield u, v
+
+    def complement(self, loops: bool = False) -> "BitsetGraph":
+        """
+        :param loops: Whether a vertex without a loop gets one in the complement. If not, the complement has no loops
+        :return: The graph with an edge wherever this graph has none
+        """
+        full = (1 << self._n) - 1
+        rows = [~row & full for row in self._rows]
+        if not loops:
+            rows = [row & ~(1 << i) for (i, row) in enumerate(rows)]
+        return BitsetGraph(self._n, self._directed, rows, self._labels)
+
+    def _check_compatible(self, other: "BitsetGraph"):
+        if not isinstance(other, BitsetGraph):
+            raise TypeError("Can only combine a BitsetGraph with another BitsetGraph")
+        if self._n != other._n or self._directed != other._directed:
+            raise ValueError("Can only combine graphs with the same vertices and directedness")
+
+    def __and__(self, other: "BitsetGraph") -> "BitsetGraph":
+        """
+        :param other: A graph on the same vertices
+        :return: The graph with the edges of both graphs
+        """
+        self._check_compatible(other)
+        return BitsetGraph(self._n, self._directed, [a & b for (a, b) in zip(self._rows, other._rows)], self._labels)
+
+    def __or__(self, other: "BitsetGraph") -> "BitsetGraph":
+        """
+        :param other: A graph on the same vertices
+        :return: The graph with the edges of either graph
+        """
+        self._check_compatible(other)
+        return BitsetGraph(self._n, self._directed, [a | b for (a, b) in zip(self._rows, other._rows)], self._labels)
+
+    def __xor__(self, other: "BitsetGraph") -> "BitsetGraph":
+        """
+        :param other: A graph on the same vertices
+        :return: The graph with the edges of exactly one of the graphs
+        """
+        self._check_compatible(other)
+        return BitsetGraph(self._n, self._directed, [a ^ b for (a, b) in zip(self._rows, other._rows)], self._labels)
+
+    def __sub__(self, other: "BitsetGraph") -> "BitsetGraph":
+        """
+        :param other: A graph on the same vertices
+        :return: The graph with the edges of `self` that are not in `other`
+        """
+        self._check_compatible(other)
+        return BitsetGraph(self._n, self._directed, [a & ~b for (a, b) in zip(self._rows, other._rows)],
+                           self._labels)
@@ -0,0 +1,262 @@
+"""
+Builders for common and random simple graphs. Every builder creates its edges in one pass through
+`Graph.add_edges_from`, so the cost is linear in the size of the output. Random builders take a `seed`, which is
+either `None`, an integer, or a `random.Random` instance.
+"""
+import math
+import random
+from collections import defaultdict
+from itertools import combinations, permutations
+from typing import Iterator, Optional, Set, Tuple, Union
+
+from graph.graph import Graph, GraphError
+
+Seed = Union[None, int, random.Random]
+
+
+def _rng(seed: Seed) -> random.Random:
+    """
+    Turns a seed into a random number generator
+    :param seed: `None`, an integer, or a `random.Random` instance, which is used as is
+    :return: The random number generator
+    """
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+
+def _build(n: int, edges, directed: bool, graph_class) -> Graph:
+    """
+    Creates a simple graph on `n` vertices with the given edges
+    :param n: The number of vertices
+    :param edges: The edges as pairs of vertex indices
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    graph = graph_class(directed=directed, simple=True, n=n)
+    graph.add_edges_from(edges)
+    return graph
+
+
+def complete_graph(n: int, directed: bool = False, graph_class=Graph) -> Graph:
+    """
+    The complete graph K_n. If directed, there is an edge in both directions between every pair of vertices.
+    :param n: The number of vertices
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    pairs = permutations(range(n), 2) if directed else combinations(range(n), 2)
+    return _build(n, pairs, directed, graph_class)
+
+
+def path_graph(n: int, directed: bool = False, graph_class=Graph) -> Graph:
+    """
+    The path P_n on `n` vertices, going from vertex 0 to vertex n-1.
+    :param n: The number of vertices
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    return _build(n, ((i, i + 1) for i in range(n - 1)), directed, graph_class)
+
+
+def cycle_graph(n: int, directed: bool = False, graph_class=Graph) -> Graph:
+    """
+    The cycle C_n on `n` vertices, going from vertex 0 through vertex n-1 and back.
+    :param n: The number of vertices, at least 3 (or 2 if directed)
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    if n < (2 if directed else 3):
+        raise GraphError(f"Can not create a simple cycle with {n} vertices")
+    return _build(n, ((i, (i + 1) % n) for i in range(n)), directed, graph_class)
+
+
+def grid_graph(rows: int, columns: int, directed: bool = False, graph_class=Graph) -> Graph:
+    """
+    The `rows` by `columns` grid. Vertex `r * columns + c` is in row `r` and column `c`, and if directed the edges
+    point to the right and downwards.
+    :param rows: The number of rows
+    :param columns: The number of columns
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    def edges() -> Iterator[Tuple[int, int]]:
+        for r in range(rows):
+            for c in range(columns):
+                v = r * columns + c
+                if c + 1 < columns:
+                    yield v, v + 1
+                if r + 1 < rows:
+                    yield v, v + columns
+
+    return _build(rows * columns, edges(), directed, graph_class)
+
+
+def star_graph(n: int, directed: bool = False, graph_class=Graph) -> Graph:
+    """
+    The star with centre vertex 0 and `n` leaves. If directed, the edges point away from the centre.
+    :param n: The number of leaves
+    :param directed: Whether the graph should be directed
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    return _build(n + 1, ((0, i) for i in range(1, n + 1)), directed, graph_class)
+
+
+def _pair(k: int, n: int, directed: bool) -> Tuple[int, int]:
+    """
+    Decodes an index into the list of all possible edges of a simple graph on `n` vertices
+    :param k: The index, `0 <= k < n(n-1)` if directed, `0 <= k < n(n-1)/2` otherwise
+    :param n: The number of vertices
+    :param directed: Whether the graph is directed
+    :return: The edge as a pair of vertex indices
+    """
+    if directed:
+        u, v = divmod(k, n - 1)
+        return u, v + (v >= u)
+    v = (1 + math.isqrt(1 + 8 * k)) // 2
+    return v, k - v * (v - 1) // 2
+
+
+def gnp_random_graph(n: int, p: float, directed: bool = False, seed: Seed = None, graph_class=Graph) -> Graph:
+    """
+    The Erdos-Renyi graph G(n, p), where every possible edge is present independently with probability `p`. The gaps
+    between successive edges are drawn from a geometric distribution (Batagelj and Brandes), so the running time is
+    linear in the number of edges rather than in n^2.
+    :param n: The number of vertices
+    :param p: The probability of every edge
+    :param directed: Whether the graph should be directed
+    :param seed: The seed of the random number generator
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    rng = _rng(seed)
+    total = n * (n - 1) if directed else n * (n - 1) // 2
+
+    def edges() -> Iterator[Tuple[int, int]]:
+        if p <= 0:
+            return
+        if p >= 1:
+            yield from (_pair(k, n, directed) for k in range(total))
+            return
+
+        log_q = math.log(1.0 - p)
+        k = -1
+        while True:
+            k += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if k >= total:
+                return
+            yield _pair(k, n, directed)
+
+    return _build(n, edges(), directed, graph_class)
+
+
+def gnm_random_graph(n: int, m: int, directed: bool = False, seed: Seed = None, graph_class=Graph) -> Graph:
+    """
+    The Erdos-Renyi graph G(n, m), chosen uniformly among the simple graphs with `n` vertices and `m` edges.
+    :param n: The number of vertices
+    :param m: The number of edges
+    :param directed: Whether the graph should be directed
+    :param seed: The seed of the random number generator
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    total = n * (n - 1) if directed else n * (n - 1) // 2
+    if m > total:
+        raise GraphError(f"Can not create a simple graph with {m} edges on {n} vertices")
+
+    indices = _rng(seed).sample(range(total), m)
+    return _build(n, (_pair(k, n, directed) for k in indices), directed, graph_class)
+
+
+def random_regular_graph(d: int, n: int, seed: Seed = None, graph_class=Graph, max_tries: int = 100) -> Graph:
+    """
+    A random simple undirected `d`-regular graph on `n` vertices. Edge stubs are paired at random, and stubs that
+    would create a loop or a multi-edge are re-paired among themselves (Steger and Wormald), restarting if that gets
+    stuck.
+    :param d: The degree of every vertex
+    :param n: The number of vertices
+    :param seed: The seed of the random number generator
+    :param graph_class: The class of the graph
+    :param max_tries: How often to restart before giving up
+    :return: The graph
+    """
+    if (n * d) % 2 != 0 or not 0 <= d < n:
+        raise GraphError(f"Can not create a {d}-regular graph on {n} vertices")
+
+    rng = _rng(seed)
+
+    def suitable(edges: Set[Tuple[int, int]], potential: dict) -> bool:
+        if not potential:
+            return True
+        for s1, s2 in combinations(potential, 2):
+            if s1 > s2:
+                s1, s2 = s2, s1
+            if (s1, s2) not in edges:
+                return True
+        return False
+
+    def try_creation() -> Optional[Set[Tuple[int, int]]]:
+        edges = set()
+        stubs = list(range(n)) * d
+        while stubs:
+            potential = defaultdict(int)
+            rng.shuffle(stubs)
+            stub_iter = iter(stubs)
+            for s1, s2 in zip(stub_iter, stub_iter):
+                if s1 > s2:
+                    s1, s2 = s2, s1
+                if s1 != s2 and (s1, s2) not in edges:
+                    edges.add((s1, s2))
+                else:
+                    potential[s1] += 1
+                    potential[s2] += 1
+            if not suitable(edges, potential):
+                return None
+            stubs = [vertex for (vertex, count) in potential.items() for _ in range(count)]
+        return edges
+
+    for _ in range(max_tries):
+        edges = try_creation()
+        if edges is not None:
+            return _build(n, sorted(edges), False, graph_class)
+
+    raise GraphError(f"Failed to create a {d}-regular graph on {n} vertices in {max_tries} tries")
+
+
+def preferential_attachment_graph(n: int, m: int, seed: Seed = None, graph_class=Graph) -> Graph:
+    """
+    A Barabasi-Albert graph: starting from `m` isolated vertices, every new vertex is joined to `m` distinct existing
+    vertices chosen with probability proportional to their degree.
+    :param n: The number of vertices
+    :param m: The number of edges added with every new vertex
+    :param seed: The seed of the random number generator
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    if not 1 <= m < n:
+        raise GraphError(f"Can not create a preferential attachment graph with m={m} and n={n}")
+
+    rng = _rng(seed)
+
+    def edges() -> Iterator[Tuple[int, int]]:
+        targets = list(range(m))
+        # every vertex appears once for every edge it is incident with
+        repeated = []
+        for source in range(m, n):
+            for target in targets:
+                yield source, target
+            repeated.extend(targets)
+            repeated.extend([source] * m)
+
+            chosen = set()
+            while len(chosen) < m:
+                chosen.add(rng.choice(repeated))
+            targets = list(chosen)
+
+    return _build(n, edges(), False, graph_class)
@@ -4,7 +4,28 @@ This is a module for working with directed and undirected multigraphs.
 # version: 29-01-2015, Paul Bonsma
 # version: 01-02-2017, Pieter Bos, Tariq Bontekoe
 
-from typing import List, Union, Set
+import sys
+from collections import Counter, deque
+from itertools import combinations, product
+from typing import Any, Callable, Iterable, Iterator, KeysView, List, NamedTuple, Optional, Set, Tuple, Union
+
+from graph.csr import CSRGraph
+from graph.dense import BitsetGraph
+
+
+ADD_VERTEX = 'add_vertex'
+REMOVE_VERTEX = 'remove_vertex'
+ADD_EDGE = 'add_edge'
+REMOVE_EDGE = 'remove_edge'
+
+
+class GraphEvent(NamedTuple):
+    """
+    A single change to a `Graph`, as recorded in its journal.
+    """
+    version: int
+    kind: str
+    item: Any
 
 
 class GraphError(Exception):
@@ -26,8 +47,14 @@ class Vertex(object):
     `Vertex` objects have a property `graph` pointing to the graph they are part of,
     and an attribute `label` which can be anything: it is not used for any methods,
     except for `__str__`.
+    The edges leaving and entering the vertex are kept apart; in an undirected graph both
+    maps are the same object, holding every incident edge.
+    The vertices of a geometric graph may keep their coordinates in the attribute `pos`.
     """
 
+    __slots__ = ('_graph', 'label', 'dist', 'in_edge', 'colornum', 'colortext', 'pos',
+                 '_out', '_in', '_out_edges', '_in_edges')
+
     def __init__(self, graph: "Graph", label=None, dist=None):
         """
         Creates a vertex, part of `graph`, with optional label `label`.
@@ -42,15 +69,23 @@ class Vertex(object):
 
         self._graph = graph
         self.label = label
-        self._incidence = {}
         self.dist = dist
+        # neighbour -> set of edges between them, and the edges themselves as an insertion-ordered set
+        self._out = {}
+        self._out_edges = {}
+        if graph.directed:
+            self._in = {}
+            self._in_edges = {}
+        else:
+            self._in = self._out
+            self._in_edges = self._out_edges
 
     def __repr__(self):
         """
         A programmer-friendly representation of the vertex.
         :return: The string to approximate the constructor arguments of the `Vertex'
         """
-        return 'Vertex(label={}, #incident={})'.format(self.label, len(self._incidence))
+        return 'Vertex(label={}, #incident={})'.format(self.label, self.degree)
 
     def __str__(self) -> str:
         """
@@ -64,33 +99,53 @@ class Vertex(object):
             return self.label < other.label
         return self.dist < other.dist
 
-    def __eq__(self, other: "Vertex") -> bool:
-        return super().__eq__(other)
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
-    def __hash__(self):
-        return super().__hash__()
-
     def is_adjacent(self, other: "Vertex") -> bool:
         """
         Returns True iff `self` is adjacent to `other` vertex.
         :param other: The other vertex
         """
-        return other in self._incidence
+        return other in self._out or other in self._in
 
     def add_incidence(self, edge: "Edge"):
         """
-        For internal use only; adds an edge to the incidence map
+        For internal use only; adds an edge to the incidence maps
         :param edge: The edge that is used to add the incidence
         """
-        other = edge.other_end(self)
+        if edge.tail is self:
+            edges = self._out.get(edge.head)
+            if edges is None:
+                edges = self._out[edge.head] = set()
+            edges.add(edge)
+            self._out_edges[edge] = None
+
+        if edge.head is self:
+            edges = self._in.get(edge.tail)
+            if edges is None:
+                edges = self._in[edge.tail] = set()
+            edges.add(edge)
+            self._in_edges[edge] = None
+
+    def _remove_incidence(self, edge: "Edge"):
+        """
+        For internal use only; removes an edge from the incidence maps
+        :param edge: The edge that is used to remove the incidence
+        """
+        if edge.tail is self:
+            self._discard(self._out, edge.head, edge)
+            self._out_edges.pop(edge, None)
+
+        if edge.head is self:
+            self._discard(self._in, edge.tail, edge)
+            self._in_edges.pop(edge, None)
 
-        if other not in self._incidence:
-            self._incidence[other] = set()
+    @staticmethod
+    def _discard(incidence: dict, other: "Vertex", edge: "Edge"):
+        edges = incidence.get(other)
 
-        self._incidence[other].add(edge)
+        if edges is not None:
+            edges.discard(edge)
+            if not edges:
+                del incidence[other]
 
     @property
     def graph(self) -> "Graph":
@@ -100,32 +155,66 @@ class Vertex(object):
         """
         return self._graph
 
+    @property
+    def out_edges(self) -> KeysView["Edge"]:
+        """
+        A live, read-only view of the edges leaving the vertex; every incident edge if the graph is undirected.
+        :return: The edges leaving the vertex
+        """
+        return self._out_edges.keys()
+
+    @property
+    def in_edges(self) -> KeysView["Edge"]:
+        """
+        A live, read-only view of the edges entering the vertex; every incident edge if the graph is undirected.
+        :return: The edges entering the vertex
+        """
+        return self._in_edges.keys()
+
+    @property
+    def out_degree(self) -> int:
+        """
+        :return: The number of edges leaving the vertex
+        """
+        return len(self._out_edges)
+
+    @property
+    def in_degree(self) -> int:
+        """
+        :return: The number of edges entering the vertex
+        """
+        return len(self._in_edges)
+
     @property
     def incidence(self) -> List["Edge"]:
         """
         Returns the list of edges incident with the vertex.
         :return: The list of edges incident with the vertex
         """
-        result = set()
-
-        for edge_set in self._incidence.values():
-            result |= edge_set
+        if self._in_edges is self._out_edges:
+            return list(self._out_edges)
 
-        return list(result)
+        return list(self._out_edges) + [edge for edge in self._in_edges if edge not in self._out_edges]
 
     @property
     def neighbours(self) -> List["Vertex"]:
         """
         Returns the list of neighbors of the vertex.
         """
-        return list(self._incidence.keys())
+        if self._in is self._out:
+            return list(self._out)
+
+        return list(self._out) + [vertex for vertex in self._in if vertex not in self._out]
 
     @property
     def degree(self) -> int:
         """
         Returns the degree of the vertex
         """
-        return sum(map(len, self._incidence.values()))
+        if self._in_edges is self._out_edges:
+            return len(self._out_edges)
+
+        return len(self._out_edges) + len(self._in_edges) - len(self._out.get(self, ()))
 
 
 class Edge(object):
@@ -134,6 +223,8 @@ class Edge(object):
     (`Vertex` objects). The order of these matters when the graph is directed.
     """
 
+    __slots__ = ('_tail', '_head', '_weight', 'colornum', 'colortext')
+
     def __init__(self, tail: Vertex, head: Vertex, weight=None):
         """
         Creates an edge between vertices `tail` and `head`
@@ -215,12 +306,14 @@ class Graph(object):
     def __init__(self, directed: bool = False, n: int = 0, simple: bool = False,
                  path: bool = False, path_length: int = 0,
                  cycle: bool = False, cycle_length: int = 0,
-                 complete: bool = False):
+                 complete: bool = False, label_index: bool = False, journal_size: int = 0):
         """
         Creates a graph.
         :param directed: Whether the graph should behave as a directed graph.
         :param simple: Whether the graph should be a simple graph, that is, not have multi-edges or loops.
         :param n: Optional, the number of vertices the graph should create immediately
+        :param label_index: Whether to keep a label -> vertex index, see `vertex`
+        :param journal_size: How many of the most recent changes to keep in the journal, see `changes_since`
         """
 
         if not complete:
@@ -246,41 +339,28 @@ class Graph(object):
             if complete and (path or cycle):
                 raise GraphError(f"Can not create complete graph when wither path:{path} or cycle:{cycle} are True")
 
-        self._v = list()
-        self._e = list()
+        # insertion-ordered dicts used as sets, for O(1) membership and removal
+        self._v = dict()
+        self._e = dict()
         self._simple = simple
         self._directed = directed
         self._next_label_value = 0
+        self._labels = {} if label_index else None
+        self._version = 0
+        self._journal = deque(maxlen=journal_size) if journal_size > 0 else None
 
-        for i in range(n):
-            self.add_vertex(Vertex(self))
+        self.add_vertices(n)
 
         if not complete:
             if path:
-                for (i, vertex) in enumerate(self.vertices[:path_length]):
-                    edge = Edge(vertex, self.vertices[i+1])
-                    self.add_edge(edge)
+                self.add_edges_from((i, i + 1) for i in range(path_length))
             if cycle:
-                sublist = self.vertices[path_length+1:path_length+cycle_length+1]
-                for (i, vertex) in enumerate(sublist):
-                    edge = Edge(vertex, sublist[(i+1) % cycle_length])
-                    self.add_edge(edge)
+                first = path_length + 1
+                self.add_edges_from((first + i, first + (i + 1) % cycle_length) for i in range(cycle_length))
+        elif simple:
+            self.add_edges_from(combinations(range(n), 2))
         else:
-            self.__complete()
-
-    def __complete(self):
-        start = 1 if self.simple else 0
-        vertex_list = self.vertices if not self.simple else self.vertices[:-1]
-        # print(vertex_list)
-        for vertex in vertex_list:
-            for neighbour in self.vertices[start:]:
-                edge = Edge(vertex, neighbour)
-                if edge not in self._e:
-                    self.add_edge(edge)
-                    # print(vertex, neighbour, edge)
-            start = start + 1 if self.simple else 0
-            if start == len(self.vertices):
-                break
+            self.add_edges_from(product(range(n), repeat=2))
 
     def __repr__(self):
         """
@@ -306,6 +386,40 @@ class Graph(object):
         self._next_label_value += 1
         return result
 
+    def _record(self, kind: str, item):
+        """
+        For internal use only; bumps the version and, if the graph keeps a journal, records the change
+        :param kind: One of `ADD_VERTEX`, `REMOVE_VERTEX`, `ADD_EDGE` and `REMOVE_EDGE`
+        :param item: The vertex or edge that was added or removed
+        """
+        self._version += 1
+        if self._journal is not None:
+            self._journal.append(GraphEvent(self._version, kind, item))
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that increases with every change to the graph. A consumer that remembers the version it was
+        computed at, like `CSRGraph.version`, is stale iff the version has changed since.
+        :return: The current version
+        """
+        return self._version
+
+    def changes_since(self, version: int) -> Optional[List["GraphEvent"]]:
+        """
+        The changes made after `version`, oldest first, so that a consumer can apply them instead of recomputing.
+        :param version: A version of this graph
+        :return: The changes, or `None` if `version` is later than the current version, or the graph keeps no journal
+        or it no longer reaches back to `version`
+        """
+        if version == self._version:
+            return []
+        if version > self._version:
+            return None
+        if self._journal is None or not self._journal or self._journal[0].version > version + 1:
+            return None
+        return [event for event in self._journal if event.version > version]
+
     @property
     def simple(self) -> bool:
         """
@@ -342,6 +456,19 @@ class Graph(object):
         """
         return iter(self._v)
 
+    def iter_edges(self) -> Iterator["Edge"]:
+        """
+        :return: Returns an iterator for the edges of the graph, without copying them like `edges` does
+        """
+        return iter(self._e)
+
+    def __contains__(self, item: Union[Edge, Vertex]) -> bool:
+        """
+        :param item: A vertex or an edge
+        :return: Whether the vertex or edge is part of the graph
+        """
+        return item in self._v or item in self._e
+
     def __len__(self) -> int:
         """
         :return: The number of vertices of the graph
@@ -356,7 +483,65 @@ class Graph(object):
         if vertex.graph != self:
             raise GraphError("A vertex must belong to the graph it is added to")
 
-        self._v.append(vertex)
+        if vertex in self._v:
+            return
+
+        if self._labels is not None:
+            self.__index_label(vertex)
+        self._v[vertex] = None
+        self._record(ADD_VERTEX, vertex)
+
+    def __index_label(self, vertex: "Vertex"):
+        indexed = self._labels.setdefault(vertex.label, vertex)
+        if indexed is not vertex:
+            raise GraphError(f"Duplicate vertex label {vertex.label!r} in a graph with a label index")
+
+    def index_labels(self):
+        """
+        Starts keeping a label -> vertex index, which is then maintained when vertices are added or removed. The
+        labels of the vertices must be unique, and must not change while the index is kept.
+        """
+        if self._labels is None:
+            self._labels = {}
+            try:
+                for vertex in self._v:
+                    self.__index_label(vertex)
+            except GraphError:
+                self._labels = None
+                raise
+
+    @property
+    def label_indexed(self) -> bool:
+        """
+        :return: Whether the graph keeps a label -> vertex index
+        """
+        return self._labels is not None
+
+    def vertex(self, label) -> "Vertex":
+        """
+        Looks up a vertex by its label, in O(1) if the graph keeps a label index and in O(V) otherwise.
+        :param label: The label
+        :return: The vertex with that label
+        """
+        if self._labels is not None:
+            vertex = self._labels.get(label)
+        else:
+            vertex = next((vertex for vertex in self._v if vertex.label == label), None)
+
+        if vertex is None:
+            raise GraphError(f"No vertex with label {label!r}")
+        return vertex
+
+    def edges_between(self, label_u, label_v) -> Set["Edge"]:
+        """
+        Finds the edges from the vertex labelled `label_u` to the vertex labelled `label_v`, in either direction if
+        the graph is undirected.
+        :param label_u: The label of one vertex
+        :param label_v: The label of the other vertex
+        :return: The set of edges
+        """
+        u, v = self.vertex(label_u), self.vertex(label_v)
+        return set(u._out.get(v, ()))
 
     def add_edge(self, edge: "Edge"):
         """
@@ -377,10 +562,92 @@ class Graph(object):
         if edge.head not in self._v:
             self.add_vertex(edge.head)
 
-        self._e.append(edge)
+        self._e[edge] = None
 
         edge.head.add_incidence(edge)
         edge.tail.add_incidence(edge)
+        self._record(ADD_EDGE, edge)
+
+    def add_vertices(self, n: int) -> List["Vertex"]:
+        """
+        Creates `n` new vertices, with generated labels, and adds them to the graph in one pass.
+        :param n: The number of vertices to add
+        :return: The new vertices
+        """
+        vertices = [Vertex(self) for _ in range(n)]
+        if self._labels is not None:
+            # check every label before indexing any, so that a duplicate leaves the index unchanged
+            labels = {}
+            for vertex in vertices:
+                if vertex.label in self._labels or vertex.label in labels:
+                    raise GraphError(f"Duplicate vertex label {vertex.label!r} in a graph with a label index")
+                labels[vertex.label] = vertex
+            self._labels.update(labels)
+        self._v.update(dict.fromkeys(vertices))
+        for vertex in vertices:
+            self._record(ADD_VERTEX, vertex)
+        return vertices
+
+    def add_edges_from(self, edges: Iterable[tuple]) -> List["Edge"]:
+        """
+        Add many edges in one pass, without going through `add_edge` for each of them. Every edge is given as a
+        `(u, v)` or `(u, v, weight)` tuple, where the ends are vertices or integer indices into `vertices` (as it was
+        when this method was called). Missing end vertices are added, and the checks of `add_edge` for simple graphs
+        are applied to every edge.
+        :param edges: The edges to be added
+        :return: The new edges
+        """
+        indexed = None
+        simple = self._simple
+        vertex_set = self._v
+        edge_set = self._e
+        new_edges = []
+
+        for item in edges:
+            tail, head = item[0], item[1]
+            weight = item[2] if len(item) > 2 else None
+
+            if type(tail) is int or type(head) is int:
+                if indexed is None:
+                    indexed = list(vertex_set)
+                if type(tail) is int:
+                    tail = indexed[tail]
+                if type(head) is int:
+                    head = indexed[head]
+
+            if simple:
+                if tail is head:
+                    raise GraphError('No loops allowed in simple graphs')
+
+                if head in tail._out:
+                    raise GraphError('No multiedges allowed in simple graphs')
+
+            if tail not in vertex_set:
+                self.add_vertex(tail)
+            if head not in vertex_set:
+                self.add_vertex(head)
+
+            edge = Edge(tail, head, weight)
+            edge_set[edge] = None
+            new_edges.append(edge)
+            self._record(ADD_EDGE, edge)
+
+            # inlined `add_incidence` for both ends
+            parallel = tail._out.get(head)
+            if parallel is None:
+                tail._out[head] = {edge}
+            else:
+                parallel.add(edge)
+            tail._out_edges[edge] = None
+
+            parallel = head._in.get(tail)
+            if parallel is None:
+                head._in[tail] = {edge}
+            else:
+                parallel.add(edge)
+            head._in_edges[edge] = None
+
+        return new_edges
 
     def __add__(self, other: "Graph") -> "Graph":
         """
@@ -393,43 +660,116 @@ class Graph(object):
         other.__add_to(g)
         return g
 
-    def __sub__(self, other: "Graph") -> "Graph":
-        g = Graph(self.directed, simple=self.simple)
-        self.__add_to(g)
-        for edge in g.edges:
-            if edge in other.edges:
-                g.remove_edge(edge)
+    def edge_key(self, edge: "Edge") -> tuple:
+        """
+        A key that identifies an edge across graphs by the labels of its ends and its weight. The ends of an
+        undirected edge are unordered.
+        :param edge: An edge of the graph
+        :return: The key of the edge
+        """
+        if self._directed:
+            return edge.tail.label, edge.head.label, edge.weight
+        return frozenset((edge.tail.label, edge.head.label)), edge.weight
+
+    def edge_counts(self) -> Counter:
+        """
+        :return: The multiplicity of every edge key of the graph, see `edge_key`
+        """
+        return Counter(map(self.edge_key, self._e))
+
+    def __combine(self, other: "Graph", multiplicity: Callable[[int, int], int], vertices: str) -> "Graph":
+        """
+        Builds a new graph on copies of vertices, with every edge key occurring `multiplicity(count in self, count in
+        other)` times. Runs in O(V + E), assuming the labels within each graph are unique. The new graph is simple if
+        both graphs are, unless it gets two edges between the same ends, such as an edge whose weight differs
+        between the graphs in a union.
+        :param vertices: 'self' for the vertices of `self`, 'common' for those of `self` whose labels also occur in
+        `other`, or 'both' for those of `self` and those of `other` whose labels do not occur in `self`
+        """
+        if self._directed != other.directed:
+            raise GraphError("Can only combine two directed or two undirected graphs")
+
+        counts, other_counts = self.edge_counts(), other.edge_counts()
+        quota = {key: multiplicity(counts[key], other_counts[key]) for key in counts.keys() | other_counts.keys()}
+
+        new_edges = []
+        for graph in (self, other):
+            for edge in graph.edges:
+                key = graph.edge_key(edge)
+                if quota[key] > 0:
+                    quota[key] -= 1
+                    new_edges.append((edge.tail.label, edge.head.label, edge.weight))
+
+        simple = self._simple and other.simple
+        if simple:
+            ends = {(tail, head) if self._directed else frozenset((tail, head)) for (tail, head, _) in new_edges}
+            simple = len(ends) == len(new_edges)
+
+        g = Graph(self._directed, simple=simple)
+        by_label = {}
+        other_labels = {vertex.label for vertex in other} if vertices == 'common' else None
+        for vertex in list(self._v) + (list(other) if vertices == 'both' else []):
+            if vertex.label not in by_label and (other_labels is None or vertex.label in other_labels):
+                by_label[vertex.label] = Vertex(g, vertex.label)
+                g.add_vertex(by_label[vertex.label])
+
+        g.add_edges_from([(by_label[tail], by_label[head], weight) for (tail, head, weight) in new_edges])
         return g
 
+    def difference(self, other: "Graph") -> "Graph":
+        """
+        The edges of `self` that are not in `other`, matched by `edge_key` and respecting multiplicities, on copies
+        of the vertices of `self`.
+        :param other: The graph whose edges are taken away
+        :return: The new graph
+        """
+        return self.__combine(other, lambda a, b: max(a - b, 0), 'self')
+
+    def intersection(self, other: "Graph") -> "Graph":
+        """
+        The edges in both graphs, matched by `edge_key` and respecting multiplicities, on copies of the vertices of
+        `self` whose labels also occur in `other`.
+        :param other: The other graph
+        :return: The new graph
+        """
+        return self.__combine(other, min, 'common')
+
+    def union(self, other: "Graph") -> "Graph":
+        """
+        The edges in either graph, matched by `edge_key` and respecting multiplicities, on copies of the vertices of
+        both graphs, identified by label. Unlike `+`, vertices with the same label are merged.
+        :param other: The other graph
+        :return: The new graph
+        """
+        return self.__combine(other, max, 'both')
+
+    def symmetric_difference(self, other: "Graph") -> "Graph":
+        """
+        The edges in exactly one of the graphs, matched by `edge_key` and respecting multiplicities, on copies of the
+        vertices of both graphs, identified by label.
+        :param other: The other graph
+        :return: The new graph
+        """
+        return self.__combine(other, lambda a, b: abs(a - b), 'both')
+
+    def __sub__(self, other: "Graph") -> "Graph":
+        return self.difference(other)
+
+    def __and__(self, other: "Graph") -> "Graph":
+        return self.intersection(other)
+
+    def __or__(self, other: "Graph") -> "Graph":
+        return self.union(other)
+
+    def __xor__(self, other: "Graph") -> "Graph":
+        return self.symmetric_difference(other)
+
     def __add_to(self, g):
-        old_vertices = {}
-        old_edges = {}
-        # print(f"vertices are : {self.vertices}")
-        for vertex in self.vertices:
-            if vertex not in old_vertices.keys():
-                new_vertex = Vertex(g, vertex.label)
-                old_vertices[vertex] = new_vertex
-                g.add_vertex(new_vertex)
-                # print(f"added -> from old label: {str(vertex)} -> to new label: {str(new_vertex)}")
-            else:
-                new_vertex = old_vertices[vertex]
-            for edge in vertex.incidence:
-                old_neighbour = edge.other_end(vertex)
-                if old_neighbour not in old_vertices.keys():
-                    new_neighbour = Vertex(g, old_neighbour.label)
-                    g.add_vertex(new_neighbour)
-                    old_vertices[old_neighbour] = new_neighbour
-                    # print(f"added -> from old label - {str(old_neighbour)}: to new label - {str(new_neighbour)}")
-                else:
-                    new_neighbour = old_vertices[old_neighbour]
-
-                if edge not in old_edges.keys():
-                    new_edge = Edge(new_vertex, new_neighbour, edge.weight)
-                    old_edges[edge] = new_edge
-                    g.add_edge(new_edge)
-                    # print(f"added -> from old label: {str(edge)} -> to new label: {str(new_edge)}")
-        # print(f"old vertices: {old_vertices}")
-        # print(f"old edges: {old_edges}")
+        new_vertices = {}
+        for vertex in self._v:
+            new_vertices[vertex] = Vertex(g, vertex.label)
+            g.add_vertex(new_vertices[vertex])
+        g.add_edges_from((new_vertices[edge.tail], new_vertices[edge.head], edge.weight) for edge in self._e)
 
     @classmethod
     def copy(cls, graph: "Graph") -> "Graph":
@@ -465,6 +805,30 @@ class Graph(object):
 
         return self
 
+    def out_edges(self, vertex: "Vertex") -> KeysView["Edge"]:
+        """
+        The edges an algorithm may follow when leaving `vertex`; every incident edge if the graph is undirected.
+        Graph views override this, so algorithms should prefer it over `Vertex.out_edges`.
+        :param vertex: The vertex
+        :return: The edges leaving the vertex
+        """
+        return vertex._out_edges.keys()
+
+    def in_edges(self, vertex: "Vertex") -> KeysView["Edge"]:
+        """
+        The edges an algorithm may follow when entering `vertex`; every incident edge if the graph is undirected.
+        :param vertex: The vertex
+        :return: The edges entering the vertex
+        """
+        return vertex._in_edges.keys()
+
+    def endpoints(self, edge: "Edge") -> Tuple["Vertex", "Vertex"]:
+        """
+        :param edge: An edge of the graph
+        :return: The `(tail, head)` of the edge as seen by this graph
+        """
+        return edge.tail, edge.head
+
     def find_edge(self, u: "Vertex", v: "Vertex") -> Set["Edge"]:
         """
         Tries to find edges between two vertices.
@@ -472,12 +836,7 @@ class Graph(object):
         :param v: The other vertex
         :return: The set of edges incident with both `u` and `v`
         """
-        result = u._incidence.get(v, set())
-
-        if not self._directed:
-            result |= v._incidence.get(u, set())
-
-        return set(result)
+        return u._out.get(v, set()) | u._in.get(v, set())
 
     def is_adjacent(self, u: "Vertex", v: "Vertex") -> bool:
         """
@@ -487,76 +846,159 @@ class Graph(object):
         :param v: The other vertex
         :return: Whether the vertices are adjacent
         """
-        return v in u.neighbours and (not self.directed or any(e.head == v for e in u.incidence))
+        return v in u._out
+
+    def to_dense(self) -> "BitsetGraph":
+        """
+        Creates the dense bitset form of the graph. Vertex `i` of the result is `self.vertices[i]`, and multi-edges
+        collapse into a single edge.
+        :return: The dense graph
+        """
+        return BitsetGraph.from_graph(self)
 
     def get_complement(self) -> "Graph":
+        """
+        Creates the complement of the graph on copies of its vertices, computed row by row on adjacency bitsets.
+        Loops are complemented as well, unless the graph is simple.
+        :return: The complement
+        """
+        dense = self.to_dense().complement(loops=not self.simple)
         g = Graph(directed=self.directed, simple=self.simple)
-        self.__add_to(g)
-        edges_to_add = []
-        edges_to_remove = []
-        for u in g.vertices:
-            for v in g.vertices:
-                # print(f"finding for: {u}-{v}")
-                edges = g.find_edge(u, v)
-                if len(edges) > 0:
-                    for edge in edges:
-                        # print(f"removing edge -> {edge}")
-                        edges_to_remove.append(edge)
-                else:
-                    # print(f"Checking edge: {u}-{v}")
-                    if self.simple and ((u == v) or Edge(v, u) in edges_to_add):
-                        pass
-                    elif Edge(u, v) not in edges_to_add:
-                        edges_to_add.append(Edge(u, v))
-
-        for edge in edges_to_remove:
-            # print(f"removing edge -> {edge}")
-            if edge in g.edges:
-                g.remove_edge(edge)
-
-        for edge in edges_to_add:
-            # if not g.simple or (g.simple and len(g.find_edge(edge.head, edge.tail)) == 0):
-                # print(f"Adding edge: {edge}")
-            g.add_edge(edge)
+        vertices = [Vertex(g, vertex.label) for vertex in self._v]
+        for vertex in vertices:
+            g.add_vertex(vertex)
+        g.add_edges_from((vertices[u], vertices[v]) for (u, v) in dense.edges())
         return g
 
+    def stats(self, deep: bool = False) -> dict:
+        """
+        Reports the size and structure of the graph, and the memory used by its containers as measured by
+        `sys.getsizeof`. Shared objects, such as the incidence maps of an undirected graph, are counted once.
+        :param deep: Whether to also measure the `Vertex` and `Edge` objects, their labels and their weights
+        :return: A dict with the counts, the degree distribution and a 'bytes' breakdown
+        """
+        degrees = Counter(vertex.degree for vertex in self._v)
+        n, m = len(self._v), len(self._e)
+
+        incidence_dicts = edge_sets = 0
+        for vertex in self._v:
+            maps = (vertex._out, vertex._out_edges) if vertex._in is vertex._out else \
+                (vertex._out, vertex._in, vertex._out_edges, vertex._in_edges)
+            incidence_dicts += sum(map(sys.getsizeof, maps))
+            edge_sets += sum(sys.getsizeof(edges) for edges in vertex._out.values())
+            if vertex._in is not vertex._out:
+                edge_sets += sum(sys.getsizeof(edges) for edges in vertex._in.values())
+
+        sizes = {
+            'vertices': sys.getsizeof(self._v),
+            'edges': sys.getsizeof(self._e),
+            'incidence_dicts': incidence_dicts,
+            'edge_sets': edge_sets,
+        }
+        if deep:
+            sizes['vertex_objects'] = sum(sys.getsizeof(vertex) + sys.getsizeof(vertex.label) for vertex in self._v)
+            sizes['edge_objects'] = sum(sys.getsizeof(edge) + (sys.getsizeof(edge.weight) if edge.weight is not None
+                                                               else 0) for edge in self._e)
+        sizes['total'] = sum(sizes.values())
+
+        return {
+            'vertices': n,
+            'edges': m,
+            'directed': self._directed,
+            'degree_distribution': dict(sorted(degrees.items())),
+            'min_degree': min(degrees) if n else 0,
+            'max_degree': max(degrees) if n else 0,
+            'mean_degree': sum(degree * count for (degree, count) in degrees.items()) / n if n else 0.0,
+            'bytes': sizes,
+            'set_overhead_per_edge': edge_sets / m if m else 0.0,
+        }
+
+    def freeze(self) -> "CSRGraph":
+        """
+        Takes an immutable compressed-sparse-row snapshot of the graph. Vertex `i` of the snapshot is
+        `self.vertices[i]`, and later changes to the graph are not reflected in it.
+        :return: The CSR snapshot
+        """
+        index = {vertex: i for (i, vertex) in enumerate(self._v)}
+        edge_index = {edge: i for (i, edge) in enumerate(self._e)}
+        tails, heads, weights, edge_ids = [], [], [], []
+
+        for edge in self._e:
+            tail, head = index[edge.tail], index[edge.head]
+            tails.append(tail)
+            heads.append(head)
+            weights.append(edge.weight)
+            edge_ids.append(edge_index[edge])
+            if not self._directed and tail != head:
+                tails.append(head)
+                heads.append(tail)
+                weights.append(edge.weight)
+                edge_ids.append(edge_index[edge])
+
+        return CSRGraph.from_arcs(len(self._v), tails, heads, weights, self._directed,
+                                  [vertex.label for vertex in self._v], edge_ids, len(self._e), self._version)
+
     def remove_edge(self, edge: "Edge"):
         edge.head._remove_incidence(edge)
         edge.tail._remove_incidence(edge)
-        self._e.remove(edge)
-        pass
+        del self._e[edge]
+        self._record(REMOVE_EDGE, edge)
 
     def remove_vertex(self, vertex: "Vertex"):
         for edge in vertex.incidence:
             # print(f"Removing edge: {edge}")
             self.remove_edge(edge)
-        self._v.remove(vertex)
+        del self._v[vertex]
+        if self._labels is not None and self._labels.get(vertex.label) is vertex:
+            del self._labels[vertex.label]
+        self._record(REMOVE_VERTEX, vertex)
 
 
 class UnsafeGraph(Graph):
+    # the lists handed out by `vertices` and `edges`, with the version they were built at
+    _vertex_list = (None, None)
+    _edge_list = (None, None)
+
     @property
     def vertices(self) -> List["Vertex"]:
-        return self._v
+        """
+        :return: The list of vertices of the graph. It is only rebuilt after the graph changed, so the same list is
+        handed out until then, and it must not be modified
+        """
+        version, vertices = self._vertex_list
+        if version != self._version:
+            vertices = list(self._v)
+            self._vertex_list = (self._version, vertices)
+        return vertices
 
     @property
     def edges(self) -> List["Edge"]:
-        return self._e
+        """
+        :return: The list of edges of the graph. It is only rebuilt after the graph changed, so the same list is
+        handed out until then, and it must not be modified
+        """
+        version, edges = self._edge_list
+        if version != self._version:
+            edges = list(self._e)
+            self._edge_list = (self._version, edges)
+        return edges
 
     def add_vertex(self, vertex: "Vertex"):
-        self._v.append(vertex)
+        if self._labels is not None:
+            self._labels[vertex.label] = vertex
+        self._v[vertex] = None
+        self._record(ADD_VERTEX, vertex)
 
     def add_edge(self, edge: "Edge"):
-        self._e.append(edge)
+        self._e[edge] = None
 
         edge.head.add_incidence(edge)
         edge.tail.add_incidence(edge)
+        self._record(ADD_EDGE, edge)
 
     def find_edge(self, u: "Vertex", v: "Vertex") -> Set["Edge"]:
-        left = u._incidence.get(v, None)
-        right = None
-
-        if not self._directed:
-            right = v._incidence.get(u, None)
+        left = u._out.get(v, None)
+        right = u._in.get(v, None)
 
         if left is None and right is None:
             return set()
@@ -570,4 +1012,4 @@ class UnsafeGraph(Graph):
         return left | right
 
     def is_adjacent(self, u: "Vertex", v: "Vertex") -> bool:
-        return v in u._incidence or (not self._directed and u in v._incidence)
+        return v in u._out
@@ -1,5 +1,6 @@
 """
-Includes functions for reading and writing graphs, in a very simple readable format.
+Includes functions for reading and writing graphs, in a very simple readable format, and readers for the DIMACS,
+METIS, SNAP and Matrix Market formats of common benchmark graphs.
 """
 # Version: 30-01-2015, Paul Bonsma
 # Version: 29-01-2017, Pieter Bos
@@ -9,13 +10,53 @@ Includes functions for reading and writing graphs, in a very simple readable for
 # updated 5-2-2015: no black fill color used, when more than numcolors**2 vertices.
 # updated 29-1-2017: pep8 reformat, general improvements
 
+import asyncio
+import bz2
+import codecs
+import gzip
+import lzma
+import mmap as mmap_module
+import inspect
+import os
+import struct
 import sys
-from typing import IO, Tuple, List, Union
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+from typing import IO, AsyncIterator, Iterable, Iterator, List, Optional, Tuple, Union
 
-from graph.graph import Graph, Edge
+from graph.csr import CSRGraph, weight_array
+from graph.graph import Graph, GraphError
 
 DEFAULT_COLOR_SCHEME = "paired12"
 NUM_COLORS = 12
+# number of lines the writers join into a single write
+CHUNK_LINES = 1 << 14
+# number of bytes the async readers request at a time
+CHUNK_BYTES = 1 << 16
+# openers for compressed files by extension; they (de)compress in a streaming fashion
+COMPRESSED_OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+PathType = Union[str, os.PathLike]
+# deletes the characters of integers from a block of edge lines, leaving only its separators
+_NUMBER_CHARACTERS = str.maketrans('', '', '0123456789+-')
+
+
+def _is_path(f) -> bool:
+    return isinstance(f, (str, os.PathLike))
+
+
+def open_graph_file(path: PathType, mode: str = 'r') -> IO[str]:
+    """
+    Open a graph file as text, transparently decompressing or compressing `.gz`, `.bz2` and `.xz` files.
+    :param path: The path of the file
+    :param mode: 'r' to read or 'w' to write
+    :return: The opened file
+    """
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(os.fspath(path))[1].lower())
+    if opener is None:
+        return open(path, mode)
+    return opener(path, mode + 't')
 
 
 def read_line(f: IO[str]) -> str:
@@ -32,80 +73,258 @@ def read_line(f: IO[str]) -> str:
     return line
 
 
-def read_graph(graphclass, f: IO[str]) -> Tuple[Graph, List[str], bool]:
+def _parse_edge_lines(edge_lines: List[str]) -> List[tuple]:
     """
-    Read a graph from a file
-    :param graphclass: The class of the graph
-    :param f: The file
-    :return: The graph
+    Parse a block of edge lines of the form `u,v` or `u,v:weight`
+    :param edge_lines: The lines
+    :return: The edges as `(u, v)` or `(u, v, weight)` tuples; parsing stops at the first malformed line
     """
-    options = []
-
-    while True:
-        try:
-            line = read_line(f)
-            n = int(line)
-            graph = graphclass(directed=False, n=n)
-            break
-        except ValueError:
-            if len(line) > 0 and line[-1] == '\n':
-                options.append(line[:-1])
-            else:
-                options.append(line)
+    text = ''.join(edge_lines)
+    colons = text.count(':')
+
+    # fast path: if every line is `u,v` or every line is `u,v:weight`, without spaces, convert the whole block at once
+    if colons == 0 or colons == len(edge_lines):
+        width = 3 if colons else 2
+        separators = (',:\n' if colons else ',\n') * len(edge_lines)
+        if text.translate(_NUMBER_CHARACTERS) in (separators, separators[:-1]):
+            try:
+                values = list(map(int, text.replace(',', ' ').replace(':', ' ').split()))
+            except ValueError:
+                values = None
+            # with the separators in place, a missing number is the only way to get fewer values
+            if values is not None and len(values) == width * len(edge_lines):
+                columns = [iter(values)] * width
+                return list(zip(*columns))
 
-    line = read_line(f)
     edges = []
-
-    try:
-        while True:
+    for line in edge_lines:
+        try:
             comma = line.find(',')
             if ':' in line:
                 colon = line.find(':')
                 edges.append((int(line[:comma]), int(line[comma + 1:colon]), int(line[colon + 1:])))
             else:
                 edges.append((int(line[:comma]), int(line[comma + 1:]), None))
-            line = read_line(f)
-    except Exception:
-        pass
+        except ValueError:
+            break
+    return edges
 
-    indexed_nodes = list(graph.vertices)
 
-    for edge in edges:
-        graph += Edge(indexed_nodes[edge[0]], indexed_nodes[edge[1]], edge[2])
+def _parse_graph(lines: Iterator[str], parse_edges: bool = True) -> Optional[Tuple[int, List[str], List[tuple], bool]]:
+    """
+    Parse a single graph from an iterator over the lines of a file, consuming its `---` separator line if any
+    :param lines: The lines
+    :param parse_edges: Whether to parse the edges; if not, they are only skipped over and no edges are returned
+    :return: The number of vertices, the options, the edges as tuples, and whether another graph follows; or `None`
+    if the lines ran out before the number of vertices
+    """
+    options = []
+    n = None
 
-    if line != '' and line[0] == '-':
-        return graph, options, True
-    else:
-        return graph, options, False
+    for line in lines:
+        if line[:1] == '#':
+            continue
+        try:
+            n = int(line)
+            break
+        except ValueError:
+            options.append(line[:-1] if line[-1:] == '\n' else line)
+
+    if n is None:
+        return None
+
+    edge_lines = []
+    append = edge_lines.append
+    last = ''
+    for line in lines:
+        first = line[:1]
+        if first == '#':
+            continue
+        if first == '-' or not line.strip():
+            last = line
+            break
+        if parse_edges:
+            append(line)
+
+    return n, options, _parse_edge_lines(edge_lines), last[:1] == '-'
+
+
+def _build_graph(graphclass, n: int, edges: Iterable[tuple], directed: bool = False) -> Graph:
+    """
+    Build a parsed graph in one batch
+    :param graphclass: The class of the graph
+    :param n: The number of vertices
+    :param edges: The edges as tuples of vertex indices and an optional weight
+    :param directed: Whether the graph is directed
+    :return: The graph
+    """
+    graph = graphclass(directed=directed, n=n)
+    graph.add_edges_from(edges)
+    return graph
+
+
+def read_graph(graphclass, f: IO[str]) -> Tuple[Graph, List[str], bool]:
+    """
+    Read a graph from a file. Only the lines of this graph and its `---` separator are consumed.
+    :param graphclass: The class of the graph
+    :param f: The file
+    :return: The graph
+    """
+    parsed = _parse_graph(iter(f))
+    if parsed is None:
+        raise GraphError("Unexpected end of file before the number of vertices")
+
+    n, options, edges, cont = parsed
+    return _build_graph(graphclass, n, edges), options, cont
+
+
+def iter_graphs(f: Union[IO[str], PathType], graph_class=Graph, start: int = 0) \
+        -> Iterator[Tuple[Graph, List[str]]]:
+    """
+    Read the graphs of a file one at a time, so that only one of them is in memory at once
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
+    :param graph_class: The class of the graphs
+    :param start: The number of graphs to skip over, without parsing their edges or building them
+    :return: An iterator over pairs of a graph and the options that preceded it
+    """
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            yield from iter_graphs(file, graph_class, start)
+        return
+
+    lines = iter(f)
+    cont = True
+    index = 0
+
+    while cont:
+        parsed = _parse_graph(lines, parse_edges=index >= start)
+        if parsed is None:
+            return
+        n, options, edges, cont = parsed
+        if index >= start:
+            yield _build_graph(graph_class, n, edges), options
+        index += 1
 
 
 def read_graph_list(graph_class, f: IO[str]) -> Tuple[List[Graph], List[str]]:
     """
-    Read a list of graphs from a file
+    Read a list of graphs from a file, up to its end
     :param graph_class: The graph class
     :param f: The file
     :return: A list of graphs
     """
     options = []
     graphs = []
-    cont = True
 
-    while cont:
-        graph, new_options, cont = read_graph(graph_class, f)
+    for graph, new_options in iter_graphs(f, graph_class):
         options += new_options
         graphs.append(graph)
 
     return graphs, options
 
 
-def load_graph(f: IO[str], graph_class=Graph, read_list: bool = False) -> Union[Tuple[List[Graph], List[str]], Graph]:
+def _graph_ranges(path: PathType) -> List[Tuple[int, int]]:
+    """
+    Split a file into the byte ranges of its graphs, by scanning it once for lines that start with `-`. Every range
+    but the last ends with its separator line.
+    :param path: The path of an uncompressed file
+    :return: The `(start, end)` byte offsets of the graphs
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return [(0, 0)]
+        with mmap_module.mmap(file.fileno(), 0, access=mmap_module.ACCESS_READ) as mm:
+            ranges = []
+            start = 0
+            separator = mm.find(b'\n-')
+            while separator >= 0:
+                end = mm.find(b'\n', separator + 1)
+                end = size if end < 0 else end + 1
+                ranges.append((start, end))
+                start = end
+                separator = mm.find(b'\n-', end - 1)
+            if start < size:
+                ranges.append((start, size))
+            return ranges
+
+
+def _parse_range(path: PathType, start: int, end: int):
+    """
+    Parse the graph in a byte range of a file, in a worker process of `load_graph`
+    :param path: The path of the file
+    :param start: The offset of the first byte of the graph
+    :param end: The offset just past its last byte
+    :return: `None` if the range holds no graph, and otherwise a compact payload of the number of vertices, the
+    options, the tails, heads and weights of the edges as arrays (see `weight_array`), and whether another graph follows
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode()
+
+    parsed = _parse_graph(iter(text.splitlines(keepends=True)))
+    if parsed is None:
+        return None
+
+    n, options, edges, cont = parsed
+    tails = array('q', [edge[0] for edge in edges])
+    heads = array('q', [edge[1] for edge in edges])
+    weights = weight_array([edge[2] if len(edge) > 2 else None for edge in edges])
+    return n, options, tails, heads, weights, cont
+
+
+def read_graph_list_parallel(graph_class, path: PathType, workers: int) -> Tuple[List[Graph], List[str]]:
+    """
+    Read a list of graphs from an uncompressed file, parsing the graphs in parallel in a pool of processes. Only
+    the graphs are built in this process. Unlike `read_graph_list`, every line that starts with `-` is taken to be a
+    separator, even among the options.
+    :param graph_class: The graph class
+    :param path: The path of the file
+    :param workers: The number of worker processes
+    :return: A list of graphs
+    """
+    ranges = _graph_ranges(path)
+    starts = [start for (start, end) in ranges]
+    ends = [end for (start, end) in ranges]
+
+    options = []
+    graphs = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(ranges) // (4 * workers))
+        for payload in pool.map(_parse_range, repeat(path), starts, ends, chunksize=chunksize):
+            if payload is None:
+                break
+            n, new_options, tails, heads, weights, cont = payload
+            options += new_options
+            edges = zip(tails, heads) if weights is None else zip(tails, heads, weights)
+            graphs.append(_build_graph(graph_class, n, edges))
+            # like `read_graph_list`, stop at a graph that is not followed by a separator
+            if not cont:
+                break
+
+    return graphs, options
+
+
+def load_graph(f: Union[IO[str], PathType], graph_class=Graph, read_list: bool = False, workers: int = 1) \
+        -> Union[Tuple[List[Graph], List[str]], Graph]:
     """
     Load a graph from a file
-    :param f: The file
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
     :param graph_class: The class of the graph. You may subclass the default graph class and add your own here.
     :param read_list: Specifies whether to read a list of graphs from the file, or just a single graph.
+    :param workers: The number of processes that parse a list of graphs, see `read_graph_list_parallel`. Only used
+    if `f` is the path of an uncompressed file
     :return: The graph, or a list of graphs.
     """
+    if read_list and workers > 1 and _is_path(f) \
+            and os.path.splitext(os.fspath(f))[1].lower() not in COMPRESSED_OPENERS:
+        return read_graph_list_parallel(graph_class, f, workers)
+
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            return load_graph(file, graph_class, read_list)
+
     if read_list:
         graph_list, options = read_graph_list(graph_class, f)
         return graph_list, options
@@ -124,6 +343,170 @@ def input_graph(graph_class=Graph, read_list: bool = False) -> Union[Tuple[List[
     return load_graph(f=sys.stdin, graph_class=graph_class, read_list=read_list)
 
 
+def _numbers(tokens: List[str]) -> list:
+    """
+    Convert tokens to numbers in bulk
+    :param tokens: The tokens
+    :return: The tokens as ints, or as floats if they are not all ints
+    """
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        try:
+            return list(map(float, tokens))
+        except ValueError:
+            raise GraphError("Expected numbers in the edge section") from None
+
+
+def load_dimacs(f: Union[IO[str], PathType], graph_class=Graph) -> Graph:
+    """
+    Load a directed graph from a DIMACS shortest path file, with a `p sp n m` problem line and `a u v w` arc lines.
+    The vertices are numbered from 1 in the file, and vertex `i` of the file is `graph.vertices[i - 1]`.
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            return load_dimacs(file, graph_class)
+
+    n = None
+    arc_lines = []
+    for line in f:
+        first = line[:1]
+        if first == 'a':
+            arc_lines.append(line)
+        elif first == 'p':
+            problem = line.split()
+            if len(problem) < 4 or problem[1] != 'sp':
+                raise GraphError(f"Expected a shortest path problem line, got {line.strip()!r}")
+            n = int(problem[2])
+
+    if n is None:
+        raise GraphError("Missing the problem line of the DIMACS file")
+
+    tokens = ''.join(arc_lines).split()
+    if len(tokens) != 4 * len(arc_lines):
+        raise GraphError("Every arc line must have the form 'a u v w'")
+    tails = map(int, tokens[1::4])
+    heads = map(int, tokens[2::4])
+    weights = _numbers(tokens[3::4])
+
+    return _build_graph(graph_class, n, zip((u - 1 for u in tails), (v - 1 for v in heads), weights), True)
+
+
+def load_metis(f: Union[IO[str], PathType], graph_class=Graph) -> Graph:
+    """
+    Load an undirected graph from a METIS file, with a `n m [fmt [ncon]]` header and one adjacency line per vertex.
+    Edge weights are kept; vertex sizes and weights are skipped. The vertices are numbered from 1 in the file, and
+    vertex `i` of the file is `graph.vertices[i - 1]`.
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            return load_metis(file, graph_class)
+
+    lines = (line for line in f if line[:1] != '%')
+    header = next(lines, '').split()
+    if len(header) < 2:
+        raise GraphError("Missing the header line of the METIS file")
+
+    n = int(header[0])
+    fmt = header[2].zfill(3) if len(header) > 2 else '000'
+    has_sizes, has_vertex_weights, has_edge_weights = (c == '1' for c in fmt[-3:])
+    ncon = int(header[3]) if len(header) > 3 else 1
+    skip = has_sizes + (ncon if has_vertex_weights else 0)
+
+    def edges() -> Iterator[tuple]:
+        for u, line in enumerate(islice(lines, n), 1):
+            tokens = line.split()[skip:]
+            if has_edge_weights and len(tokens) % 2:
+                raise GraphError(f"Expected pairs of a neighbour and a weight on the line of vertex {u}")
+            try:
+                neighbours = list(map(int, tokens[::2] if has_edge_weights else tokens))
+            except ValueError:
+                raise GraphError(f"Expected integer neighbours on the line of vertex {u}") from None
+            # every edge is listed at both ends, so keep it at its smaller end only
+            if has_edge_weights:
+                weights = _numbers(tokens[1::2])
+                yield from ((u - 1, v - 1, w) for (v, w) in zip(neighbours, weights) if u < v)
+            else:
+                yield from ((u - 1, v - 1) for v in neighbours if u < v)
+
+    graph = _build_graph(graph_class, n, edges())
+    if len(graph.edges) != int(header[1]):
+        raise GraphError(f"Expected {header[1]} edges, found {len(graph.edges)}")
+    return graph
+
+
+def load_snap(f: Union[IO[str], PathType], graph_class=Graph, directed: bool = True) -> Graph:
+    """
+    Load a graph from a SNAP edge list, with one `u v` pair of vertex ids per line and `#` comments. The ids need not
+    be contiguous: they are renumbered in order of first appearance, and kept as the labels of the vertices.
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
+    :param graph_class: The class of the graph
+    :param directed: Whether the graph is directed
+    :return: The graph
+    """
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            return load_snap(file, graph_class, directed)
+
+    values = list(map(int, ''.join(line for line in f if line[:1] != '#').split()))
+    if len(values) % 2:
+        raise GraphError("Every edge line must have the form 'u v'")
+
+    # an insertion-ordered dict used as a set, to number the ids in order of first appearance
+    ids = dict.fromkeys(values)
+    index = {vertex_id: i for (i, vertex_id) in enumerate(ids)}
+
+    graph = _build_graph(graph_class, len(index), zip(map(index.__getitem__, values[0::2]),
+                                                       map(index.__getitem__, values[1::2])), directed)
+    for vertex, vertex_id in zip(graph.vertices, ids):
+        vertex.label = vertex_id
+    return graph
+
+
+def load_matrix_market(f: Union[IO[str], PathType], graph_class=Graph) -> Graph:
+    """
+    Load a graph from a Matrix Market file in coordinate format, with entry `(i, j)` as an edge from vertex `i` to
+    vertex `j`. Real and integer entries become edge weights, pattern matrices give unweighted graphs, and symmetric
+    matrices give undirected graphs. The vertices are numbered from 1 in the file, and vertex `i` of the file is
+    `graph.vertices[i - 1]`.
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    if _is_path(f):
+        with open_graph_file(f) as file:
+            return load_matrix_market(file, graph_class)
+
+    banner = f.readline().split()
+    if len(banner) != 5 or banner[0] != '%%MatrixMarket' or banner[1].lower() != 'matrix':
+        raise GraphError("Missing the %%MatrixMarket matrix banner")
+    layout, field, symmetry = (word.lower() for word in banner[2:])
+    if layout != 'coordinate' or field not in ('pattern', 'real', 'integer') \
+            or symmetry not in ('general', 'symmetric'):
+        raise GraphError(f"Unsupported Matrix Market format: {' '.join(banner[2:])}")
+
+    lines = (line for line in f if line[:1] != '%' and line.strip())
+    rows, columns, entries = map(int, next(lines, '0 0 0').split())
+    if rows != columns:
+        raise GraphError(f"The adjacency matrix must be square, not {rows}x{columns}")
+
+    width = 2 if field == 'pattern' else 3
+    tokens = ''.join(lines).split()
+    if len(tokens) != width * entries:
+        raise GraphError(f"Expected {entries} entries of {width} values")
+    tails = (i - 1 for i in map(int, tokens[0::width]))
+    heads = (j - 1 for j in map(int, tokens[1::width]))
+    edges = zip(tails, heads) if width == 2 else zip(tails, heads, _numbers(tokens[2::3]))
+
+    return _build_graph(graph_class, rows, edges, symmetry == 'general')
+
+
 def write_line(f: IO[str], line: str):
     """
     Write a line to a file
@@ -133,49 +516,119 @@ def write_line(f: IO[str], line: str):
     f.write(line + '\n')
 
 
-def write_graph_list(graph_list: List[Graph], f: IO[str], options=[]):
+def _write_chunks(f: IO[str], lines: Iterable[str], chunk_lines: int = CHUNK_LINES):
     """
-    Write a graph list to a file.
-    :param graph_list: The list of graphs
-    :param f: the file
-    :param options: the (optional) options to write to the file.
+    Write lines to a file in large chunks, instead of one `write` per line
+    :param f: The file
+    :param lines: The lines, including their line ends
+    :param chunk_lines: The number of lines per chunk
     """
+    for chunk in _chunks(lines, chunk_lines):
+        f.write(chunk)
+
+
+def _chunks(lines: Iterable[str], chunk_lines: int = CHUNK_LINES) -> Iterator[str]:
+    """
+    Join lines into large chunks
+    :param lines: The lines, including their line ends
+    :param chunk_lines: The number of lines per chunk
+    :return: An iterator over the chunks
+    """
+    lines = iter(lines)
+    while True:
+        chunk = ''.join(islice(lines, chunk_lines))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _option_lines(options) -> Iterator[str]:
     # we may only write options that cannot be seen as an integer:
     for S in options:
         try:
             int(S)
         except ValueError:
-            write_line(f, str(S))
+            yield str(S) + '\n'
 
-    for i, g in enumerate(graph_list):
-        n = len(g)
-        write_line(f, '# Number of vertices:')
-        write_line(f, str(n))
 
-        # Give the vertices (temporary) labels from 0 to n-1:
-        label = {}
-        for vertex_index, vertex in enumerate(g):
-            label[vertex] = vertex_index
+def _edge_list_lines(n: int, edge_lines: Iterable[str]) -> Iterator[str]:
+    yield '# Number of vertices:\n'
+    yield str(n) + '\n'
+    yield '# Edge list:\n'
+    yield from edge_lines
 
-        write_line(f, '# Edge list:')
 
-        for e in g.edges:
-            if e.weight:
-                write_line(f, str(label[e.tail]) + ',' + str(label[e.head]) + ':' + str(e.weight))
-            else:
-                write_line(f, str(label[e.tail]) + ',' + str(label[e.head]))
+def _graph_edge_lines(g: Graph) -> Iterator[str]:
+    """
+    :param g: A graph
+    :return: The edge lines of the graph, with the vertices numbered in the order of iteration
+    """
+    # Give the vertices (temporary) labels from 0 to n-1:
+    label = {vertex: vertex_index for (vertex_index, vertex) in enumerate(g)}
+
+    for e in g.iter_edges():
+        if e.weight:
+            yield f'{label[e.tail]},{label[e.head]}:{e.weight}\n'
+        else:
+            yield f'{label[e.tail]},{label[e.head]}\n'
+
+
+def _tuple_edge_lines(edges: Iterable[tuple]) -> Iterator[str]:
+    """
+    :param edges: Edges as `(u, v)` or `(u, v, weight)` tuples of vertex indices
+    :return: The edge lines
+    """
+    for edge in edges:
+        if len(edge) > 2 and edge[2]:
+            yield f'{edge[0]},{edge[1]}:{edge[2]}\n'
+        else:
+            yield f'{edge[0]},{edge[1]}\n'
+
+
+def _graph_list_lines(graph_list: List[Graph], options) -> Iterator[str]:
+    yield from _option_lines(options)
+
+    for i, g in enumerate(graph_list):
+        yield from _edge_list_lines(len(g), _graph_edge_lines(g))
 
         if i + 1 < len(graph_list):
-            write_line(f, '--- Next graph:')
+            yield '--- Next graph:\n'
+
+
+def write_graph_list(graph_list: List[Graph], f: IO[str], options=[]):
+    """
+    Write a graph list to a file.
+    :param graph_list: The list of graphs
+    :param f: the file
+    :param options: the (optional) options to write to the file.
+    """
+    _write_chunks(f, _graph_list_lines(graph_list, options))
+
+
+def write_edges(f: IO[str], n: int, edges: Iterable[tuple], options=[]):
+    """
+    Write a single graph to a file straight from its edges, without building a `Graph`. The edges are consumed
+    lazily, so they can come from a generator.
+    :param f: The file
+    :param n: The number of vertices
+    :param edges: The edges as `(u, v)` or `(u, v, weight)` tuples, with `u` and `v` between 0 and n-1
+    :param options: the (optional) options to write to the file.
+    """
+    _write_chunks(f, chain(_option_lines(options), _edge_list_lines(n, _tuple_edge_lines(edges))))
 
 
-def save_graph(graph_list: Union[Graph, List[Graph]], f: IO[str], options=[]):
+def save_graph(graph_list: Union[Graph, List[Graph]], f: Union[IO[str], PathType], options=[]):
     """
     Write a graph, or a list of graphs to a file.
     :param graph_list: The graph, or a list of graphs.
-    :param f: The file
+    :param f: The file, or its path, which may be compressed, see `open_graph_file`
     :param options: the (optional) options to write to the file.
     """
+    if _is_path(f):
+        with open_graph_file(f, 'w') as file:
+            save_graph(graph_list, file, options)
+        return
+
     if type(graph_list) is list:
         write_graph_list(graph_list, f, options)
     else:
@@ -194,24 +647,161 @@ def print_graph(graph_list: Union[Graph, List[Graph]], options=[]):
         write_graph_list([graph_list], sys.stdout, options)
 
 
-def write_dot(graph: Graph, f: IO[str], directed=False):
+async def _maybe_await(result):
     """
-    Writes a given graph to a file in .dot format.
-    :param graph: The graph. If its vertices contain attributes `label`, `colortext` or `colornum`, these are also
-    included in the file. If its edges contain an attribute `weight`, these are also included in the file.
-    :param f: The file.
-    :param directed: Whether the graph should be drawn as a directed graph.
+    :param result: The result of a method that may or may not be a coroutine method
+    :return: The result, awaited if it is awaitable
     """
-    if directed:
-        f.write('digraph G {\n')
-    else:
-        f.write('graph G {\n')
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def _iter_line_chunks(reader, encoding: str = 'utf-8') -> AsyncIterator[List[str]]:
+    """
+    Read the complete lines of a stream, one chunk at a time, and yield to the event loop after every chunk
+    :param reader: An object with a (coroutine) method `read(size)` that returns bytes or str, such as an
+    `asyncio.StreamReader` or an aiofiles file
+    :param encoding: The encoding of the stream, if it returns bytes
+    :return: An async iterator over lists of lines, including their line ends
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ''
+
+    while True:
+        chunk = await _maybe_await(reader.read(CHUNK_BYTES))
+        text = decoder.decode(chunk, final=not chunk) if isinstance(chunk, bytes) else chunk
+        # the line ends are normalised as by a file opened in text mode
+        lines = (pending + text).replace('\r\n', '\n').split('\n')
+        pending = lines.pop()
+        if lines:
+            yield [line + '\n' for line in lines]
+        if not chunk:
+            if pending:
+                yield [pending]
+            return
+        await asyncio.sleep(0)
+
+
+async def iter_graphs_async(reader, graph_class=Graph, encoding: str = 'utf-8') \
+        -> AsyncIterator[Tuple[Graph, List[str]]]:
+    """
+    Read the graphs of an async stream one at a time. The edges are parsed and added to the graph as the chunks of
+    the stream arrive, so that the event loop is never blocked for long.
+    :param reader: An object with a (coroutine) method `read(size)` that returns bytes or str, such as an
+    `asyncio.StreamReader` or an aiofiles file
+    :param graph_class: The class of the graphs
+    :param encoding: The encoding of the stream, if it returns bytes
+    :return: An async iterator over pairs of a graph and the options that preceded it
+    """
+    options = []
+    graph = None
+    vertices = None
+    complete = True
+
+    def add_edges(edge_lines: List[str]) -> bool:
+        edges = _parse_edge_lines(edge_lines)
+        graph.add_edges_from([(vertices[edge[0]], vertices[edge[1]]) + edge[2:] for edge in edges])
+        # like `_parse_edge_lines`, the rest of the edges of a graph are dropped after a malformed line
+        return len(edges) == len(edge_lines)
+
+    async for lines in _iter_line_chunks(reader, encoding):
+        edge_lines = []
+        for line in lines:
+            first = line[:1]
+            if first == '#':
+                continue
+
+            if graph is None:
+                try:
+                    n = int(line)
+                except ValueError:
+                    options.append(line[:-1] if line[-1:] == '\n' else line)
+                    continue
+                graph = graph_class(directed=False, n=n)
+                vertices = graph.vertices
+                complete = True
+                continue
+
+            if first == '-' or not line.strip():
+                if complete and edge_lines:
+                    add_edges(edge_lines)
+                yield graph, options
+                if first != '-':
+                    return
+                options = []
+                graph = None
+                edge_lines = []
+                continue
+
+            edge_lines.append(line)
+
+        if complete and edge_lines:
+            complete = add_edges(edge_lines)
+
+    if graph is not None:
+        yield graph, options
+
+
+async def load_graph_async(reader, graph_class=Graph, read_list: bool = False, encoding: str = 'utf-8') \
+        -> Union[Tuple[List[Graph], List[str]], Graph]:
+    """
+    Load a graph from an async stream, see `iter_graphs_async`
+    :param reader: An object with a (coroutine) method `read(size)` that returns bytes or str, such as an
+    `asyncio.StreamReader` or an aiofiles file
+    :param graph_class: The class of the graph. You may subclass the default graph class and add your own here.
+    :param read_list: Specifies whether to read a list of graphs from the stream, or just a single graph.
+    :param encoding: The encoding of the stream, if it returns bytes
+    :return: The graph, or a list of graphs.
+    """
+    options = []
+    graphs = []
+
+    graph_iterator = iter_graphs_async(reader, graph_class, encoding)
+    try:
+        async for graph, new_options in graph_iterator:
+            options += new_options
+            graphs.append(graph)
+            if not read_list:
+                break
+    finally:
+        await graph_iterator.aclose()
+
+    if read_list:
+        return graphs, options
+    if not graphs:
+        raise GraphError("Unexpected end of file before the number of vertices")
+    return graphs[0]
+
+
+async def save_graph_async(graph_list: Union[Graph, List[Graph]], writer, options=[],
+                           encoding: Optional[str] = 'utf-8'):
+    """
+    Write a graph, or a list of graphs to an async stream, in chunks, yielding to the event loop after every chunk.
+    :param graph_list: The graph, or a list of graphs.
+    :param writer: An object with a (coroutine) method `write`, such as an `asyncio.StreamWriter` or an aiofiles
+    file. If it has a `drain` method, as a `StreamWriter` does, that is awaited after every chunk.
+    :param options: the (optional) options to write to the stream.
+    :param encoding: The encoding of the bytes to write, or `None` to write str
+    """
+    if type(graph_list) is not list:
+        graph_list = [graph_list]
+
+    drain = getattr(writer, 'drain', None)
+    for chunk in _chunks(_graph_list_lines(graph_list, options)):
+        await _maybe_await(writer.write(chunk if encoding is None else chunk.encode(encoding)))
+        if drain is not None:
+            await drain()
+        else:
+            await asyncio.sleep(0)
+
+
+def _dot_lines(graph: Graph, directed: bool) -> Iterator[str]:
+    yield 'digraph G {\n' if directed else 'graph G {\n'
 
     name = {}
-    next_name = 0
     for v in graph:
-        name[v] = next_name
-        next_name += 1
+        name[v] = len(name)
         options = 'penwidth=3,'
         if hasattr(v, 'label'):
             options += 'label="' + str(v.label) + '",'
@@ -221,13 +811,11 @@ def write_dot(graph: Graph, f: IO[str], directed=False):
             options += 'color=' + str(v.colornum % NUM_COLORS + 1) + ', colorscheme=' + DEFAULT_COLOR_SCHEME + ','
             if v.colornum >= NUM_COLORS:
                 options += 'style=filled,fillcolor=' + str((v.colornum // NUM_COLORS) % NUM_COLORS + 1) + ','
-        if len(options) > 0:
-            f.write('    ' + str(name[v]) + ' [' + options[:-1] + ']\n')
-        else:
-            f.write('    ' + str(name[v]) + '\n')
-    f.write('\n')
+        yield f'    {name[v]} [{options[:-1]}]\n'
+    yield '\n'
 
-    for e in graph.edges:
+    arrow = ' -> ' if directed else '--'
+    for e in graph.iter_edges():
         options = 'penwidth=2,'
         if hasattr(e, 'weight'):
             options += 'label="' + str(e.weight) + '",'
@@ -235,14 +823,122 @@ def write_dot(graph: Graph, f: IO[str], directed=False):
             options += 'color="' + e.colortext + '",'
         elif hasattr(e, 'colornum'):
             options += 'color=' + str(e.colornum % NUM_COLORS + 1) + ', colorscheme=' + DEFAULT_COLOR_SCHEME + ','
-        if len(options) > 0:
-            options = ' [' + options[:-1] + ']'
-        if directed:
-            f.write('    ' + str(name[e.tail]) + ' -> ' + str(name[e.head]) + options + '\n')
-        else:
-            f.write('    ' + str(name[e.tail]) + '--' + str(name[e.head]) + options + '\n')
+        yield f'    {name[e.tail]}{arrow}{name[e.head]} [{options[:-1]}]\n'
+
+    yield '}'
+
+
+def write_dot(graph: Graph, f: IO[str], directed=False):
+    """
+    Writes a given graph to a file in .dot format.
+    :param graph: The graph. If its vertices contain attributes `label`, `colortext` or `colornum`, these are also
+    included in the file. If its edges contain an attribute `weight`, these are also included in the file.
+    :param f: The file.
+    :param directed: Whether the graph should be drawn as a directed graph.
+    """
+    _write_chunks(f, _dot_lines(graph, directed))
+
+
+# The binary format is a header followed by the arrays of a `CSRGraph`, all little-endian and 8 bytes per entry:
+# the n + 1 offsets, the targets, and the weights if there are any. Vertex labels are not stored.
+BINARY_MAGIC = b'GRPH'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<4sBBcxqqq')
+BINARY_DIRECTED = 1
+
+
+def save_graph_binary(graph: Union[Graph, CSRGraph], f: Union[PathType, IO[bytes]]):
+    """
+    Write a graph to a binary file, see `load_graph_binary`. Edge weights must be all ints, all numbers, or all None.
+    :param graph: The graph, or a frozen snapshot of it
+    :param f: The path of the file, or the file itself, opened in binary mode
+    """
+    if _is_path(f):
+        with open(f, 'wb') as file:
+            save_graph_binary(graph, file)
+        return
+
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    weights = csr.weights
+    if type(weights) is tuple:
+        raise GraphError("Only graphs with numeric weights can be saved in the binary format")
+
+    weight_code = b'n' if weights is None else weights.format.encode()
+    f.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, BINARY_DIRECTED if csr.directed else 0, weight_code,
+                               len(csr), len(csr.targets), csr.n_edges))
+
+    for values in (csr.offsets, csr.targets) + (() if weights is None else (weights,)):
+        if sys.byteorder != 'little':
+            values = array(values.format, values)
+            values.byteswap()
+        f.write(values)
+
+
+def load_graph_binary(f: Union[PathType, IO[bytes]], mmap: bool = False, graph_class=None) \
+        -> Union[CSRGraph, Graph]:
+    """
+    Read a graph written by `save_graph_binary`. Its vertices are labelled `0..n-1`.
+    :param f: The path of the file, or the file itself, opened in binary mode
+    :param mmap: Whether to map the file into memory instead of reading it. The arrays of the result then point
+    into the mapping, so processes that map the same file share a single physical copy of it
+    :param graph_class: If given, the graph is built as an instance of this class; otherwise a `CSRGraph` is returned
+    :return: The graph
+    """
+    if _is_path(f):
+        with open(f, 'rb') as file:
+            return load_graph_binary(file, mmap, graph_class)
+
+    if mmap:
+        if sys.byteorder != 'little':
+            raise GraphError("Binary graphs can only be memory-mapped on little-endian machines")
+        if os.fstat(f.fileno()).st_size < BINARY_HEADER.size:
+            raise GraphError("The binary graph file is truncated")
+        data = memoryview(mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ))
+    else:
+        data = memoryview(f.read())
+
+    if len(data) < BINARY_HEADER.size:
+        raise GraphError("The binary graph file is truncated")
+    magic, version, flags, weight_code, n, n_arcs, n_edges = BINARY_HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise GraphError("Not a binary graph file, or an unsupported version of the format")
+
+    def take(start: int, count: int, typecode: str):
+        end = start + 8 * count
+        if len(data) < end:
+            raise GraphError("The binary graph file is truncated")
+        values = data[start:end].cast(typecode)
+        if not mmap:
+            values = array(typecode, values)
+            if sys.byteorder != 'little':
+                values.byteswap()
+        return values, start + 8 * count
+
+    offsets, position = take(BINARY_HEADER.size, n + 1, 'q')
+    targets, position = take(position, n_arcs, 'q')
+    weights = None if weight_code == b'n' else take(position, n_arcs, weight_code.decode())[0]
+    csr = CSRGraph(bool(flags & BINARY_DIRECTED), range(n), offsets, targets, weights, n_edges=n_edges)
+
+    if graph_class is None:
+        return csr
+    return _thaw(csr, graph_class)
+
+
+def _thaw(csr: CSRGraph, graph_class) -> Graph:
+    """
+    Build a graph from a CSR graph, taking every undirected edge once
+    :param csr: The CSR graph
+    :param graph_class: The class of the graph
+    :return: The graph
+    """
+    graph = graph_class(directed=csr.directed, n=len(csr))
+    tails, heads, weights = csr.arc_arrays()
+    if weights is None:
+        weights = [None] * len(heads)
+    graph.add_edges_from((tail, head, weight) for (tail, head, weight) in zip(tails, heads, weights)
+                         if csr.directed or tail <= head)
+    return graph
 
-    f.write('}')
 
 if __name__ == "__main__":
     from mygraphs import MyGraph
@@ -0,0 +1,368 @@
+"""
+Read-only views of a `Graph` that copy nothing: they share the vertices and edges of the graph they are built on,
+and filter or reorient them on the fly. Views can be stacked, and the algorithms in `graph.algorithms` accept them
+anywhere they accept a `Graph`. Changes to the underlying graph show through immediately.
+"""
+from typing import Callable, Collection, Iterable, Iterator, List, Set, Tuple, Union
+
+from graph.graph import Edge, Vertex
+
+
+class GraphView(object):
+    """
+    A view that shows the underlying graph unchanged. Subclasses override `_has_vertex`, `_has_edge`, `out_edges`,
+    `in_edges` and `endpoints` to change what is shown.
+    """
+
+    def __init__(self, graph):
+        """
+        Creates a view
+        :param graph: The `Graph` or view to look at
+        """
+        self._graph = graph
+
+    def __repr__(self):
+        """
+        A programmer-friendly representation of the view.
+        :return: The string to approximate the constructor arguments of the view
+        """
+        return '{}(graph={!r})'.format(type(self).__name__, self._graph)
+
+    @property
+    def graph(self):
+        """
+        :return: The graph or view this view looks at
+        """
+        return self._graph
+
+    @property
+    def simple(self) -> bool:
+        """
+        :return: Whether the underlying graph is simple
+        """
+        return self._graph.simple
+
+    @property
+    def directed(self) -> bool:
+        """
+        :return: Whether the view behaves as a directed graph
+        """
+        return self._graph.directed
+
+    def _has_vertex(self, vertex: Vertex) -> bool:
+        return vertex in self._graph
+
+    def _has_edge(self, edge: Edge) -> bool:
+        return edge in self._graph
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """
+        :return: The list of vertices in the view
+        """
+        return [vertex for vertex in self._graph if self._has_vertex(vertex)]
+
+    @property
+    def edges(self) -> List[Edge]:
+        """
+        :return: The list of edges in the view
+        """
+        return [edge for edge in self._graph.edges if self._has_edge(edge)]
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """
+        :return: Returns an iterator for the edges of the view
+        """
+        return (edge for edge in self._graph.iter_edges() if self._has_edge(edge))
+
+    def __iter__(self):
+        """
+        :return: Returns an iterator for the vertices of the view
+        """
+        return (vertex for vertex in self._graph if self._has_vertex(vertex))
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the view
+        """
+        return sum(1 for _ in self)
+
+    def __contains__(self, item: Union[Edge, Vertex]) -> bool:
+        """
+        :param item: A vertex or an edge
+        :return: Whether the vertex or edge is part of the view
+        """
+        if isinstance(item, Vertex):
+            return self._has_vertex(item)
+        return self._has_edge(item)
+
+    def out_edges(self, vertex: Vertex) -> Iterable[Edge]:
+        """
+        :param vertex: A vertex of the view
+        :return: The edges leaving the vertex in the view
+        """
+        return self._graph.out_edges(vertex)
+
+    def in_edges(self, vertex: Vertex) -> Iterable[Edge]:
+        """
+        :param vertex: A vertex of the view
+        :return: The edges entering the vertex in the view
+        """
+        return self._graph.in_edges(vertex)
+
+    def endpoints(self, edge: Edge) -> Tuple[Vertex, Vertex]:
+        """
+        :param edge: An edge of the view
+        :return: The `(tail, head)` of the edge as seen by the view
+        """
+        return self._graph.endpoints(edge)
+
+    def find_edge(self, u: Vertex, v: Vertex) -> Set[Edge]:
+        """
+        :param u: One vertex
+        :param v: The other vertex
+        :return: The set of edges of the view incident with both `u` and `v`
+        """
+        result = {edge for edge in self.out_edges(u) if edge.other_end(u) is v}
+        result.update(edge for edge in self.in_edges(u) if edge.other_end(u) is v)
+        return result
+
+    def is_adjacent(self, u: Vertex, v: Vertex) -> bool:
+        """
+        :param u: One vertex
+        :param v: The other vertex
+        :return: Whether there is an edge from `u` to `v` in the view
+        """
+        return any(edge.other_end(u) is v for edge in self.out_edges(u))
+
+
+class SubgraphView(GraphView):
+    """
+    The subgraph induced by a set of vertices: those vertices, and the edges with both ends among them.
+    """
+
+    def __init__(self, graph, vertices: Iterable[Vertex]):
+        """
+        Creates an induced subgraph view
+        :param graph: The `Graph` or view to look at
+        :param vertices: The vertices to keep
+        """
+        super().__init__(graph)
+        # an insertion-ordered dict used as a set, so that the view lists the vertices in the given order
+        self._vertices = dict.fromkeys(vertices)
+
+    def _has_vertex(self, vertex: Vertex) -> bool:
+        return vertex in self._vertices and vertex in self._graph
+
+    def _has_edge(self, edge: Edge) -> bool:
+        return edge.tail in self._vertices and edge.head in self._vertices and edge in self._graph
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """
+        :return: The list of vertices in the view
+        """
+        return [vertex for vertex in self._vertices if vertex in self._graph]
+
+    @property
+    def edges(self) -> List[Edge]:
+        """
+        :return: The list of edges in the view
+        """
+        return [edge for vertex in self.vertices for edge in self.out_edges(vertex)
+                if self.directed or edge.tail is vertex]
+
+    def iter_edges(self) -> Iterator[Edge]:
+        """
+        :return: Returns an iterator for the edges of the view
+        """
+        return iter(self.edges)
+
+    def __iter__(self):
+        """
+        :return: Returns an iterator for the vertices of the view
+        """
+        return iter(self.vertices)
+
+    def out_edges(self, vertex: Vertex) -> List[Edge]:
+        kept = self._vertices
+        return [edge for edge in self._graph.out_edges(vertex) if edge.other_end(vertex) in kept]
+
+    def in_edges(self, vertex: Vertex) -> List[Edge]:
+        kept = self._vertices
+        return [edge for edge in self._graph.in_edges(vertex) if edge.other_end(vertex) in kept]
+
+
+class EdgeFilterView(GraphView):
+    """
+    All vertices of the graph, but only the edges accepted by a predicate and, optionally, a weight threshold.
+    """
+
+    def __init__(self, graph, predicate: Callable[[Edge], bool] = None, max_weight=None, min_weight=None):
+        """
+        Creates an edge-filtered view
+        :param graph: The `Graph` or view to look at
+        :param predicate: Optional function that returns whether to keep an edge
+        :param max_weight: Optional largest weight of a kept edge. Edges without a weight are not kept
+        :param min_weight: Optional smallest weight of a kept edge. Edges without a weight are not kept
+        """
+        super().__init__(graph)
+        self._predicate = predicate
+        self._max_weight = max_weight
+        self._min_weight = min_weight
+
+    def _keep(self, edge: Edge) -> bool:
+        if edge.weight is None and (self._max_weight is not None or self._min_weight is not None):
+            return False
+        if self._max_weight is not None and edge.weight > self._max_weight:
+            return False
+        if self._min_weight is not None and edge.weight < self._min_weight:
+            return False
+        return self._predicate is None or self._predicate(edge)
+
+    def _has_edge(self, edge: Edge) -> bool:
+        return edge in self._graph and self._keep(edge)
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """
+        :return: The list of vertices in the view
+        """
+        return self._graph.vertices
+
+    def __iter__(self):
+        """
+        :return: Returns an iterator for the vertices of the view
+        """
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the view
+        """
+        return len(self._graph)
+
+    def out_edges(self, vertex: Vertex) -> List[Edge]:
+        return [edge for edge in self._graph.out_edges(vertex) if self._keep(edge)]
+
+    def in_edges(self, vertex: Vertex) -> List[Edge]:
+        return [edge for edge in self._graph.in_edges(vertex) if self._keep(edge)]
+
+
+class ReversedView(GraphView):
+    """
+    The graph with the direction of every edge reversed. The `Edge` objects keep their `tail` and `head`; algorithms
+    should use `endpoints` and `Edge.other_end` to see the reversed direction.
+    """
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """
+        :return: The list of vertices in the view
+        """
+        return self._graph.vertices
+
+    @property
+    def edges(self) -> List[Edge]:
+        """
+        :return: The list of edges in the view
+        """
+        return self._graph.edges
+
+    def __iter__(self):
+        """
+        :return: Returns an iterator for the vertices of the view
+        """
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the view
+        """
+        return len(self._graph)
+
+    def out_edges(self, vertex: Vertex) -> Iterable[Edge]:
+        return self._graph.in_edges(vertex)
+
+    def in_edges(self, vertex: Vertex) -> Iterable[Edge]:
+        return self._graph.out_edges(vertex)
+
+    def endpoints(self, edge: Edge) -> Tuple[Vertex, Vertex]:
+        tail, head = self._graph.endpoints(edge)
+        return head, tail
+
+
+class UndirectedView(ReversedView):
+    """
+    The graph with the direction of every edge ignored, so that every incident edge of a vertex can be followed.
+    """
+
+    @property
+    def directed(self) -> bool:
+        """
+        :return: Always False
+        """
+        return False
+
+    def out_edges(self, vertex: Vertex) -> Collection[Edge]:
+        out_edges = self._graph.out_edges(vertex)
+        in_edges = self._graph.in_edges(vertex)
+        if not self._graph.directed:
+            return out_edges
+        return list(out_edges) + [edge for edge in in_edges if edge.other_end(vertex) is not vertex]
+
+    in_edges = out_edges
+
+    def endpoints(self, edge: Edge) -> Tuple[Vertex, Vertex]:
+        return self._graph.endpoints(edge)
+
+
+class DirectedView(GraphView):
+    """
+    The graph with every edge followed only from its `tail` to its `head`, also when the graph is undirected.
+    """
+
+    @property
+    def directed(self) -> bool:
+        """
+        :return: Always True
+        """
+        return True
+
+    @property
+    def vertices(self) -> List[Vertex]:
+        """
+        :return: The list of vertices in the view
+        """
+        return self._graph.vertices
+
+    @property
+    def edges(self) -> List[Edge]:
+        """
+        :return: The list of edges in the view
+        """
+        return self._graph.edges
+
+    def __iter__(self):
+        """
+        :return: Returns an iterator for the vertices of the view
+        """
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        """
+        :return: The number of vertices of the view
+        """
+        return len(self._graph)
+
+    def out_edges(self, vertex: Vertex) -> Collection[Edge]:
+        out_edges = self._graph.out_edges(vertex)
+        if self._graph.directed:
+            return out_edges
+        return [edge for edge in out_edges if edge.tail is vertex]
+
+    def in_edges(self, vertex: Vertex) -> Collection[Edge]:
+        in_edges = self._graph.in_edges(vertex)
+        if self._graph.directed:
+            return in_edges
+        return [edge for edge in in_edges if edge.head is vertex]
@@ -0,0 +1,142 @@
+import threading
+import time
+import unittest
+
+from graph.concurrent import ConcurrentGraph, ReadWriteLock
+from graph.graph import Graph
+
+TIMEOUT = 5
+
+
+def wait_for_writer(lock: ReadWriteLock):
+    deadline = time.monotonic() + TIMEOUT
+    while not lock._waiting_writers and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def start(target) -> threading.Thread:
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestReadWriteLock(unittest.TestCase):
+
+    def test_readers_hold_the_lock_in_parallel(self):
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=TIMEOUT)
+
+        def reader():
+            with lock.read():
+                barrier.wait()
+
+        threads = [start(reader) for _ in range(2)]
+        barrier.wait()
+        for thread in threads:
+            thread.join(TIMEOUT)
+            self.assertFalse(thread.is_alive())
+
+    def test_writer_waits_for_readers(self):
+        lock = ReadWriteLock()
+        written = threading.Event()
+
+        def writer():
+            with lock.write():
+                written.set()
+
+        with lock.read():
+            thread = start(writer)
+            self.assertFalse(written.wait(0.2))
+        self.assertTrue(written.wait(TIMEOUT))
+        thread.join(TIMEOUT)
+
+    def test_readers_wait_for_writer(self):
+        lock = ReadWriteLock()
+        read = threading.Event()
+
+        def reader():
+            with lock.read():
+                read.set()
+
+        with lock.write():
+            thread = start(reader)
+            self.assertFalse(read.wait(0.2))
+        self.assertTrue(read.wait(TIMEOUT))
+        thread.join(TIMEOUT)
+
+    def test_read_is_reentrant_while_a_writer_waits(self):
+        lock = ReadWriteLock()
+        writer_waiting = threading.Event()
+        done = threading.Event()
+
+        def writer():
+            writer_waiting.set()
+            with lock.write():
+                pass
+
+        def reader():
+            with lock.read():
+                start(writer)
+                writer_waiting.wait(TIMEOUT)
+                wait_for_writer(lock)
+                with lock.read():
+                    done.set()
+
+        start(reader)
+        self.assertTrue(done.wait(TIMEOUT))
+
+    def test_write_inside_read_raises(self):
+        lock = ReadWriteLock()
+        with lock.read():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+
+class TestConcurrentGraph(unittest.TestCase):
+
+    def setUp(self):
+        graph = Graph(n=3)
+        graph.add_edges_from([(0, 1, 1), (1, 2, 2)])
+        self.concurrent = ConcurrentGraph(graph)
+
+    def test_snapshot_is_reused_until_the_graph_changes(self):
+        snapshot = self.concurrent.snapshot()
+        self.assertIs(self.concurrent.snapshot(), snapshot)
+
+        with self.concurrent.write() as graph:
+            graph.add_vertices(1)
+
+        changed = self.concurrent.snapshot()
+        self.assertIsNot(changed, snapshot)
+        self.assertEqual(len(changed), 4)
+        self.assertEqual(len(snapshot), 3)
+
+    def test_snapshot_and_copy_inside_read_and_write(self):
+        with self.concurrent.read():
+            self.assertEqual(len(self.concurrent.snapshot()), 3)
+            self.assertEqual(len(self.concurrent.copy()), 3)
+        with self.concurrent.write() as graph:
+            graph.add_vertices(1)
+            self.assertEqual(len(self.concurrent.snapshot()), 4)
+
+    def test_snapshot_inside_read_while_a_writer_waits(self):
+        done = threading.Event()
+
+        def writer():
+            with self.concurrent.write() as graph:
+                graph.add_vertices(1)
+
+        def reader():
+            with self.concurrent.read():
+                start(writer)
+                wait_for_writer(self.concurrent._lock)
+                self.concurrent.snapshot()
+                self.concurrent.copy()
+                done.set()
+
+        start(reader)
+        self.assertTrue(done.wait(TIMEOUT))
+
+
+if __name__ == '__main__':
+    unittest.main()
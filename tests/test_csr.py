@@ -0,0 +1,34 @@
+import unittest
+
+from graph.csr import np
+from graph.graph import Graph
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class TestToNumpy(unittest.TestCase):
+
+    def test_arrays_are_read_only(self):
+        graph = Graph(directed=True, n=3)
+        graph.add_edges_from([(0, 1, 1), (1, 2, 2)])
+        csr = graph.freeze()
+
+        for name, values in csr.to_numpy().items():
+            with self.subTest(name):
+                with self.assertRaises(ValueError):
+                    values[0] = 2
+
+        self.assertEqual(list(csr.targets), [1, 2])
+        self.assertEqual(list(csr.weights), [1, 2])
+
+    def test_mixed_weights(self):
+        graph = Graph(directed=True, n=3)
+        graph.add_edges_from([(0, 1, None), (1, 2, 2)])
+
+        weights = graph.freeze().to_numpy()['weights']
+
+        self.assertFalse(weights.flags.writeable)
+        self.assertEqual(list(weights), [None, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
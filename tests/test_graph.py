@@ -0,0 +1,124 @@
+import unittest
+
+from graph.graph import Edge, Graph, GraphError, UnsafeGraph, Vertex
+
+
+class TestGraphSetOperations(unittest.TestCase):
+
+    def test_difference_keeps_vertices_missing_from_other(self):
+        path = Graph(n=3, path=True, path_length=2)
+
+        difference = path - Graph(n=2)
+
+        self.assertEqual(sorted(vertex.label for vertex in difference), [0, 1, 2])
+        self.assertEqual(sorted((edge.tail.label, edge.head.label) for edge in difference.edges), [(0, 1), (1, 2)])
+
+    def test_difference_with_disjoint_labels(self):
+        path = Graph(n=3, path=True, path_length=2)
+
+        difference = path.difference(Graph())
+
+        self.assertEqual(len(difference), 3)
+        self.assertEqual(len(difference.edges), 2)
+
+    def test_difference_removes_common_edges(self):
+        path = Graph(n=3, path=True, path_length=2)
+        other = Graph(n=2, path=True, path_length=1)
+
+        difference = path - other
+
+        self.assertEqual(len(difference), 3)
+        self.assertEqual([(edge.tail.label, edge.head.label) for edge in difference.edges], [(1, 2)])
+
+    def test_weight_change_between_simple_graphs(self):
+        def snapshot(weight):
+            graph = Graph(simple=True, n=2)
+            graph.add_edges_from([(0, 1, weight)])
+            return graph
+
+        union = snapshot(1) | snapshot(2)
+        symmetric_difference = snapshot(1) ^ snapshot(2)
+
+        self.assertFalse(union.simple)
+        self.assertEqual(sorted(edge.weight for edge in union.edges), [1, 2])
+        self.assertEqual(sorted(edge.weight for edge in symmetric_difference.edges), [1, 2])
+        self.assertTrue((snapshot(1) | snapshot(1)).simple)
+
+
+class TestUnsafeGraph(unittest.TestCase):
+
+    def test_vertices_and_edges_are_indexable(self):
+        graph = UnsafeGraph(directed=True, n=3)
+        a, b, c = graph.vertices
+        graph.add_edge(Edge(a, b))
+        graph.add_edge(Edge(b, c))
+
+        self.assertIs(graph.vertices[0], a)
+        self.assertIs(graph.edges[-1].head, c)
+
+    def test_lists_are_shared_until_the_graph_changes(self):
+        graph = UnsafeGraph(n=2)
+        vertices, edges = graph.vertices, graph.edges
+        self.assertIs(graph.vertices, vertices)
+        self.assertIs(graph.edges, edges)
+
+        edge = Edge(*vertices)
+        graph.add_edge(edge)
+
+        self.assertIsNot(graph.edges, edges)
+        self.assertEqual(graph.edges, [edge])
+        self.assertEqual(len(graph.vertices), 2)
+
+
+class TestLabelIndex(unittest.TestCase):
+
+    def test_add_vertices_with_duplicate_label_leaves_index_unchanged(self):
+        graph = Graph(label_index=True)
+        explicit = Vertex(graph, 2)
+        graph.add_vertex(explicit)
+
+        with self.assertRaises(GraphError):
+            graph.add_vertices(5)
+
+        self.assertEqual(graph.vertices, [explicit])
+        self.assertIs(graph.vertex(2), explicit)
+        with self.assertRaises(GraphError):
+            graph.vertex(0)
+
+
+class TestJournal(unittest.TestCase):
+
+    def test_changes_since(self):
+        graph = Graph(n=3, journal_size=10)
+        version = graph.version
+        a, b, c = graph.vertices
+        graph.add_edge(Edge(a, b))
+        graph.add_edge(Edge(b, c))
+
+        changes = graph.changes_since(version)
+
+        self.assertEqual([event.version for event in changes], [version + 1, version + 2])
+        self.assertEqual(graph.changes_since(graph.version), [])
+
+    def test_future_version(self):
+        graph = Graph(n=3, journal_size=10)
+        other = Graph(n=3, journal_size=10)
+        other.add_edge(Edge(other.vertices[0], other.vertices[1]))
+
+        self.assertIsNone(graph.changes_since(graph.version + 1))
+        self.assertIsNone(graph.changes_since(other.version))
+
+    def test_journal_does_not_reach_back(self):
+        graph = Graph(n=3, journal_size=1)
+        version = graph.version
+        a, b, c = graph.vertices
+        graph.add_edge(Edge(a, b))
+        graph.add_edge(Edge(b, c))
+
+        self.assertIsNone(graph.changes_since(version))
+        self.assertEqual(len(graph.changes_since(graph.version - 1)), 1)
+        self.assertIsNone(Graph(n=3).changes_since(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
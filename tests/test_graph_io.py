@@ -0,0 +1,29 @@
+import io
+import unittest
+
+from graph.graph_io import load_graph
+
+
+def edges_of(text: str) -> list:
+    graph = load_graph(io.StringIO(text))
+    return [(edge.tail.label, edge.head.label, edge.weight) for edge in graph.edges]
+
+
+class TestEdgeParsing(unittest.TestCase):
+
+    def test_well_formed_edges(self):
+        self.assertEqual(edges_of('4\n0,1\n1,2\n'), [(0, 1, None), (1, 2, None)])
+        self.assertEqual(edges_of('4\n0,1:5\n1,2:-3'), [(0, 1, 5), (1, 2, -3)])
+
+    def test_spaces_around_numbers(self):
+        self.assertEqual(edges_of('4\n0, 1:5\n1 ,2:-3\n'), [(0, 1, 5), (1, 2, -3)])
+
+    def test_malformed_line_ends_the_edges(self):
+        self.assertEqual(edges_of('4\n0,1\n2 3\n'), [(0, 1, None)])
+        self.assertEqual(edges_of('4\n0,1,2\n3\n'), [])
+        self.assertEqual(edges_of('4\n0,1:2:3\n1,2\n'), [])
+        self.assertEqual(edges_of('4\n1,\n,2\n'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
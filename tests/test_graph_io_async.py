@@ -0,0 +1,146 @@
+import asyncio
+import io
+import unittest
+
+from graph.graph import GraphError
+from graph.graph_io import iter_graphs_async, load_graph, load_graph_async, save_graph, save_graph_async
+
+GRAPHS = 'first é\n# comment\n4\n0,1:3\n1,2\n---\nsecond\n3\n0,2:-1\n--- Next graph:\n5\n0,4\n3,4:12'
+
+
+def signature(graphs: list) -> list:
+    return [(len(graph), [(edge.tail.label, edge.head.label, edge.weight) for edge in graph.edges])
+            for graph in graphs]
+
+
+class ChunkReader(object):
+    """
+    A stream that returns at most `sizes[i]` characters or bytes on its i-th read, whatever size is asked for
+    """
+
+    def __init__(self, data, sizes=(1, 2, 5, 3, 7)):
+        self.data = data
+        self.position = 0
+        self.sizes = sizes
+        self.reads = 0
+
+    async def read(self, size: int):
+        size = min(size, self.sizes[self.reads % len(self.sizes)])
+        self.reads += 1
+        chunk = self.data[self.position:self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+
+class Writer(object):
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, data: bytes):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+
+class TestLoadGraphAsync(unittest.TestCase):
+
+    def assertMatchesSerial(self, text: str, crlf: bool = False):
+        graphs, options = load_graph(io.StringIO(text), read_list=True)
+        data = text.replace('\n', '\r\n') if crlf else text
+
+        for reader in (ChunkReader(data), ChunkReader(data.encode()), ChunkReader(data, (4096,))):
+            async_graphs, async_options = asyncio.run(load_graph_async(reader, read_list=True))
+            self.assertEqual(signature(async_graphs), signature(graphs))
+            self.assertEqual(async_options, options)
+
+    def test_odd_sized_chunks(self):
+        self.assertMatchesSerial(GRAPHS)
+        self.assertMatchesSerial(GRAPHS + '\n')
+
+    def test_crlf_split_across_chunks(self):
+        text = '3\n0,1\n1,2\n---\n2\n0,1:4\n'
+        self.assertMatchesSerial(text, crlf=True)
+        # with chunks of two characters the first reads are '3\r', '\n0', ',1', '\r\n', '1,', '2\r'
+        graphs, _ = asyncio.run(load_graph_async(ChunkReader(text.replace('\n', '\r\n'), (2,)), read_list=True))
+        self.assertEqual(signature(graphs), [(3, [(0, 1, None), (1, 2, None)]), (2, [(0, 1, 4)])])
+        self.assertMatchesSerial(GRAPHS, crlf=True)
+
+    def test_separator_within_a_chunk(self):
+        text = '2\n0,1\n---\n2\n1,0\n---\n3\n0,2\n'
+        self.assertMatchesSerial(text)
+        graphs, _ = asyncio.run(load_graph_async(ChunkReader(text, (len(text),)), read_list=True))
+        self.assertEqual(len(graphs), 3)
+
+    def test_malformed_line(self):
+        for text in ('4\n0,1\n2 3\n1,2\n---\n2\n0,1\n', '4\n0,1\n1,2\n2,3\n0,x\n0,3\n', '4\n0,1:2:3\n1,2\n'):
+            with self.subTest(text=text):
+                self.assertMatchesSerial(text)
+
+    def test_blank_line_ends_the_list(self):
+        self.assertMatchesSerial('3\n0,1\n\n---\n2\n0,1\n')
+
+    def test_single_graph(self):
+        graph = asyncio.run(load_graph_async(ChunkReader(GRAPHS)))
+
+        self.assertEqual(signature([graph]), signature(load_graph(io.StringIO(GRAPHS), read_list=True)[0][:1]))
+
+    def test_empty(self):
+        self.assertEqual(asyncio.run(load_graph_async(ChunkReader(''), read_list=True)), ([], []))
+        with self.assertRaises(GraphError):
+            asyncio.run(load_graph_async(ChunkReader('# only a comment\n')))
+
+    def test_iter_graphs_async(self):
+        async def collect():
+            return [graph async for (graph, _) in iter_graphs_async(ChunkReader(GRAPHS.encode()))]
+
+        graphs, _ = load_graph(io.StringIO(GRAPHS), read_list=True)
+        self.assertEqual(signature(asyncio.run(collect())), signature(graphs))
+
+
+class TestSaveGraphAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.graphs, self.options = load_graph(io.StringIO(GRAPHS), read_list=True)
+        expected = io.StringIO()
+        save_graph(self.graphs, expected, self.options)
+        self.expected = expected.getvalue()
+
+    def test_matches_save_graph(self):
+        writer = Writer()
+
+        asyncio.run(save_graph_async(self.graphs, writer, self.options))
+
+        self.assertEqual(writer.data.decode(), self.expected)
+        self.assertGreater(writer.drains, 0)
+
+    def test_str_writer_and_single_graph(self):
+        expected = io.StringIO()
+        save_graph(self.graphs[0], expected)
+
+        class TextWriter(object):
+            def __init__(self):
+                self.text = ''
+
+            async def write(self, text: str):
+                self.text += text
+
+        writer = TextWriter()
+        asyncio.run(save_graph_async(self.graphs[0], writer, encoding=None))
+
+        self.assertEqual(writer.text, expected.getvalue())
+
+    def test_round_trip(self):
+        writer = Writer()
+        asyncio.run(save_graph_async(self.graphs, writer, self.options))
+
+        graphs, options = asyncio.run(load_graph_async(ChunkReader(bytes(writer.data)), read_list=True))
+
+        self.assertEqual(signature(graphs), signature(self.graphs))
+        self.assertEqual(options, self.options)
+
+
+if __name__ == '__main__':
+    unittest.main()
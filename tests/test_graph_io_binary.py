@@ -0,0 +1,88 @@
+import io
+import os
+import tempfile
+import unittest
+
+from graph.csr import CSRGraph
+from graph.graph import Graph, GraphError
+from graph.graph_io import load_graph_binary, save_graph_binary
+
+
+def edge_set(graph: Graph) -> list:
+    index = {vertex: i for (i, vertex) in enumerate(graph.vertices)}
+    ends = (lambda u, v: (u, v)) if graph.directed else (lambda u, v: (min(u, v), max(u, v)))
+    return sorted(ends(index[edge.tail], index[edge.head]) + (edge.weight,) for edge in graph.edges)
+
+
+def sample(directed: bool, weights) -> Graph:
+    graph = Graph(directed=directed, n=5)
+    pairs = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 4)]
+    graph.add_edges_from((u, v, w) for ((u, v), w) in zip(pairs, weights))
+    return graph
+
+
+WEIGHTS = {
+    'int': [1, -2, 3, 40, 5],
+    'float': [1.5, 2.0, -0.25, 4.0, 5.5],
+    'unweighted': [None] * 5,
+}
+
+
+class TestBinaryRoundTrip(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def round_trip(self, graph: Graph, mmap: bool, graph_class=Graph):
+        path = os.path.join(self.directory.name, 'graph.bin')
+        save_graph_binary(graph, path)
+        return load_graph_binary(path, mmap=mmap, graph_class=graph_class)
+
+    def test_round_trips(self):
+        for directed in (True, False):
+            for kind, weights in WEIGHTS.items():
+                for mmap in (False, True):
+                    with self.subTest(directed=directed, weights=kind, mmap=mmap):
+                        graph = sample(directed, weights)
+
+                        loaded = self.round_trip(graph, mmap)
+
+                        self.assertEqual(loaded.directed, directed)
+                        self.assertEqual(len(loaded), len(graph))
+                        self.assertEqual(edge_set(loaded), edge_set(graph))
+
+    def test_csr_result_matches_freeze(self):
+        for mmap in (False, True):
+            with self.subTest(mmap=mmap):
+                graph = sample(True, WEIGHTS['int'])
+
+                csr = self.round_trip(graph, mmap, graph_class=None)
+
+                frozen = graph.freeze()
+                self.assertIsInstance(csr, CSRGraph)
+                self.assertEqual(list(csr.offsets), list(frozen.offsets))
+                self.assertEqual(list(csr.targets), list(frozen.targets))
+                self.assertEqual(list(csr.weights), list(frozen.weights))
+
+    def test_edgeless_graph(self):
+        for mmap in (False, True):
+            with self.subTest(mmap=mmap):
+                loaded = self.round_trip(Graph(n=3), mmap)
+
+                self.assertEqual(len(loaded), 3)
+                self.assertEqual(loaded.edges, [])
+
+    def test_truncated_file(self):
+        buffer = io.BytesIO()
+        save_graph_binary(sample(True, WEIGHTS['int']), buffer)
+        data = buffer.getvalue()
+
+        for size in (0, 10, len(data) - 12, len(data) - 1):
+            with self.subTest(size=size):
+                with self.assertRaises(GraphError):
+                    load_graph_binary(io.BytesIO(data[:size]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tempfile
+import unittest
+
+from graph.generators import gnp_random_graph
+from graph.graph import Graph
+from graph.graph_io import iter_graphs, load_graph, open_graph_file, save_graph
+
+GRAPHS = 'first\n# comment\n4\n0,1:3\n1,2\n---\nsecond\n3\n0,2:-1\n--- Next graph:\n2\n'
+
+
+def signature(graphs: list) -> list:
+    return [(len(graph), [(edge.tail.label, edge.head.label, edge.weight) for edge in graph.edges])
+            for graph in graphs]
+
+
+class TestCompressedFiles(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.graphs, self.options = load_graph(io.StringIO(GRAPHS), read_list=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_load(self):
+        for extension, opener in (('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open), ('.GZ', gzip.open)):
+            with self.subTest(extension=extension):
+                path = self.path('graphs.gr' + extension)
+                with opener(path, 'wt') as file:
+                    file.write(GRAPHS)
+
+                graphs, options = load_graph(path, read_list=True)
+                self.assertEqual(signature(graphs), signature(self.graphs))
+                self.assertEqual(options, self.options)
+                self.assertEqual(signature([load_graph(path)]), signature(self.graphs[:1]))
+                self.assertEqual(signature([graph for (graph, _) in iter_graphs(path, start=1)]),
+                                 signature(self.graphs[1:]))
+
+    def test_save(self):
+        expected = io.StringIO()
+        save_graph(self.graphs, expected, self.options)
+
+        for extension, opener in (('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open), ('', open)):
+            with self.subTest(extension=extension):
+                path = self.path('saved.gr' + extension)
+                save_graph(self.graphs, path, self.options)
+
+                with opener(path, 'rt') as file:
+                    self.assertEqual(file.read(), expected.getvalue())
+                graphs, options = load_graph(path, read_list=True)
+                self.assertEqual(signature(graphs), signature(self.graphs))
+                self.assertEqual(options, self.options)
+
+    def test_open_graph_file(self):
+        path = self.path('graph.gr.gz')
+        with open_graph_file(path, 'w') as file:
+            file.write('2\n0,1\n')
+
+        with gzip.open(path, 'rt') as file:
+            self.assertEqual(file.read(), '2\n0,1\n')
+        with open_graph_file(path) as file:
+            self.assertEqual(signature([load_graph(file, Graph)]), signature([load_graph(io.StringIO('2\n0,1\n'))]))
+
+
+class TestParallelLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, text: str, name: str = 'graphs.gr') -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w') as file:
+            file.write(text)
+        return path
+
+    def assertMatchesSerial(self, path: str):
+        graphs, options = load_graph(path, read_list=True)
+        for workers in (2, 3):
+            with self.subTest(workers=workers):
+                parallel_graphs, parallel_options = load_graph(path, read_list=True, workers=workers)
+                self.assertEqual(signature(parallel_graphs), signature(graphs))
+                self.assertEqual(parallel_options, options)
+
+    def test_many_graphs(self):
+        graphs = [gnp_random_graph(30, 0.1, seed=seed) for seed in range(10)]
+        weighted = Graph(n=5)
+        weighted.add_edges_from([(0, 1, -2), (1, 2, 7), (3, 4, 0)])
+        graphs.insert(3, weighted)
+        path = os.path.join(self.directory.name, 'random.gr')
+        save_graph(graphs, path, ['generated', 'seeds 0-9'])
+
+        self.assertMatchesSerial(path)
+        self.assertEqual(len(load_graph(path, read_list=True, workers=2)[0]), 11)
+
+    def test_edge_cases(self):
+        for text in ('', '2\n0,1', GRAPHS, GRAPHS + '---\n', '3\n0,1\n\n---\n2\n0,1\n', '3\n0,1\n0,x\n1,2\n---\n2\n'):
+            with self.subTest(text=text):
+                self.assertMatchesSerial(self.write(text))
+
+    def test_compressed_path_is_read_serially(self):
+        path = os.path.join(self.directory.name, 'graphs.gr.gz')
+        with gzip.open(path, 'wt') as file:
+            file.write(GRAPHS)
+
+        self.assertMatchesSerial(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import io
+import unittest
+
+from graph.graph import GraphError
+from graph.graph_io import load_dimacs, load_matrix_market, load_metis, load_snap
+
+
+def edges_of(graph) -> list:
+    return sorted((edge.tail.label, edge.head.label, edge.weight) for edge in graph.edges)
+
+
+class TestDimacs(unittest.TestCase):
+
+    def test_arcs(self):
+        graph = load_dimacs(io.StringIO('c comment\np sp 3 3\na 1 2 5\na 2 3 7\na 3 1 1\n'))
+
+        self.assertTrue(graph.directed)
+        self.assertEqual(len(graph), 3)
+        self.assertEqual(edges_of(graph), [(0, 1, 5), (1, 2, 7), (2, 0, 1)])
+
+    def test_missing_problem_line(self):
+        with self.assertRaises(GraphError):
+            load_dimacs(io.StringIO('a 1 2 5\n'))
+
+
+class TestMetis(unittest.TestCase):
+
+    def test_unweighted(self):
+        graph = load_metis(io.StringIO('% comment\n4 2\n2\n1 3\n2\n\n'))
+
+        self.assertFalse(graph.directed)
+        self.assertEqual(len(graph), 4)
+        self.assertEqual(edges_of(graph), [(0, 1, None), (1, 2, None)])
+
+    def test_edge_weights(self):
+        graph = load_metis(io.StringIO('4 3 1\n2 1 3 2\n1 1\n1 2 4 9\n3 9\n'))
+
+        self.assertEqual(edges_of(graph), [(0, 1, 1), (0, 2, 2), (2, 3, 9)])
+
+    def test_float_edge_weights_and_vertex_weights(self):
+        graph = load_metis(io.StringIO('3 2 011 2\n5 6 2 1.5 3 4\n1 1 1 1.5\n7 7 1 4\n'))
+
+        self.assertEqual(edges_of(graph), [(0, 1, 1.5), (0, 2, 4.0)])
+
+    def test_bad_neighbour(self):
+        with self.assertRaises(GraphError):
+            load_metis(io.StringIO('2 1\n2.5\n1\n'))
+
+    def test_wrong_number_of_edges(self):
+        with self.assertRaises(GraphError):
+            load_metis(io.StringIO('3 2\n2\n1\n\n'))
+
+
+class TestSnap(unittest.TestCase):
+
+    def test_ids_are_renumbered_and_kept_as_labels(self):
+        graph = load_snap(io.StringIO('# comment\n10\t20\n20\t30\n10\t30\n'))
+
+        self.assertTrue(graph.directed)
+        self.assertEqual([vertex.label for vertex in graph.vertices], [10, 20, 30])
+        self.assertEqual(edges_of(graph), [(10, 20, None), (10, 30, None), (20, 30, None)])
+
+    def test_undirected(self):
+        self.assertFalse(load_snap(io.StringIO('1 2\n'), directed=False).directed)
+
+
+class TestMatrixMarket(unittest.TestCase):
+
+    def test_symmetric_real(self):
+        graph = load_matrix_market(io.StringIO(
+            '%%MatrixMarket matrix coordinate real symmetric\n% comment\n3 3 2\n2 1 1.5\n3 2 2.5\n'))
+
+        self.assertFalse(graph.directed)
+        self.assertEqual(edges_of(graph), [(1, 0, 1.5), (2, 1, 2.5)])
+
+    def test_general_pattern(self):
+        graph = load_matrix_market(io.StringIO('%%MatrixMarket matrix coordinate pattern general\n3 3 2\n1 2\n2 3\n'))
+
+        self.assertTrue(graph.directed)
+        self.assertEqual(edges_of(graph), [(0, 1, None), (1, 2, None)])
+
+    def test_unsupported_formats(self):
+        for banner in ('%%MatrixMarket matrix array real general\n3 3\n',
+                       '%%MatrixMarket matrix coordinate complex general\n1 1 0\n',
+                       '%%MatrixMarket matrix coordinate real general\n2 3 0\n'):
+            with self.subTest(banner=banner):
+                with self.assertRaises(GraphError):
+                    load_matrix_market(io.StringIO(banner))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,321 @@
+import math
+import unittest
+
+from graph.graph import Edge, Graph
+from graph.views import EdgeFilterView
+from graph.algorithms.shortest_path import LandmarkHeuristic, astar, bellman_ford_directed, bellman_ford_undirected, \
+    bellman_ford_vectorized, bfs_csr, bidirectional_dijkstra, dijkstra, dijkstra_csr, dijkstra_directed, \
+    dijkstra_undirected, euclidean_distance, haversine_distance, manhattan_distance, np, spfa
+
+
+def reversed_path() -> Graph:
+    graph = Graph(directed=True, n=3)
+    a, b, c = graph.vertices
+    graph.add_edge(Edge(b, a, 1))
+    graph.add_edge(Edge(c, b, 1))
+    return graph
+
+
+class TestDijkstra(unittest.TestCase):
+
+    def test_dijkstra_undirected_ignores_direction(self):
+        graph = reversed_path()
+
+        dijkstra_undirected(graph, graph.vertices[0])
+
+        self.assertEqual([vertex.dist for vertex in graph.vertices], [0, 1, 2])
+
+    def test_dijkstra_undirected_matches_bellman_ford_undirected(self):
+        graph = reversed_path()
+
+        dijkstra_undirected(graph, graph.vertices[0])
+        expected = [vertex.dist for vertex in graph.vertices]
+        bellman_ford_undirected(graph, graph.vertices[0])
+
+        self.assertEqual([vertex.dist for vertex in graph.vertices], expected)
+
+    def test_dijkstra_directed_follows_direction(self):
+        graph = reversed_path()
+
+        dijkstra_directed(graph, graph.vertices[0])
+
+        self.assertEqual([vertex.dist for vertex in graph.vertices], [0, math.inf, math.inf])
+
+    def test_dijkstra_directed_follows_direction_in_undirected_graph(self):
+        graph = Graph(n=2)
+        a, b = graph.vertices
+        graph.add_edge(Edge(b, a, 1))
+
+        dijkstra_directed(graph, a)
+        dist = [vertex.dist for vertex in graph.vertices]
+        bellman_ford_directed(graph, a)
+
+        self.assertEqual(dist, [0, math.inf])
+        self.assertEqual([vertex.dist for vertex in graph.vertices], dist)
+
+    def test_dijkstra_stops_at_target(self):
+        graph = Graph(n=4)
+        graph.add_edges_from([(0, 1, 1), (1, 2, 1), (2, 3, 1)])
+        a, b, c, d = graph.vertices
+
+        dist, in_edge = dijkstra(graph, a, targets=b)
+
+        self.assertEqual(dist[b], 1)
+        self.assertNotIn(d, dist)
+
+
+def road_graph(directed: bool) -> Graph:
+    graph = Graph(directed=directed, n=7)
+    graph.add_edges_from([(0, 1, 4), (0, 2, 1), (2, 1, 2), (1, 3, 5), (2, 3, 8), (3, 4, 3), (4, 5, 1), (2, 5, 20)])
+    return graph
+
+
+def path_weight(graph: Graph, path: list) -> object:
+    total = 0
+    for v, u in zip(path, path[1:]):
+        total += min(edge.weight for edge in graph.out_edges(v) if edge.other_end(v) is u)
+    return total
+
+
+class TestBidirectionalDijkstra(unittest.TestCase):
+
+    def test_matches_dijkstra(self):
+        for directed in (True, False):
+            graph = road_graph(directed)
+            for source in graph.vertices:
+                dist, _ = dijkstra(graph, source)
+                for target in graph.vertices:
+                    with self.subTest(directed=directed, source=source.label, target=target.label):
+                        length, path = bidirectional_dijkstra(graph, source, target)
+                        self.assertEqual(length, dist.get(target, math.inf))
+                        if path:
+                            self.assertIs(path[0], source)
+                            self.assertIs(path[-1], target)
+                            self.assertEqual(path_weight(graph, path), length)
+
+    def test_path(self):
+        graph = road_graph(True)
+        a, b, c, d, e, f, g = graph.vertices
+
+        self.assertEqual(bidirectional_dijkstra(graph, a, f), (12, [a, c, b, d, e, f]))
+        self.assertEqual(bidirectional_dijkstra(graph, a, a), (0, [a]))
+
+    def test_unreachable(self):
+        graph = road_graph(True)
+        a, b, c, d, e, f, g = graph.vertices
+
+        self.assertEqual(bidirectional_dijkstra(graph, a, g), (math.inf, []))
+        self.assertEqual(bidirectional_dijkstra(graph, f, a), (math.inf, []))
+
+
+def grid(width: int, height: int) -> Graph:
+    graph = Graph(n=width * height)
+    vertices = graph.vertices
+    for i, vertex in enumerate(vertices):
+        vertex.pos = divmod(i, width)
+    graph.add_edges_from([(i, i + 1, 1) for i in range(width * height) if (i + 1) % width])
+    graph.add_edges_from([(i, i + width, 1) for i in range(width * (height - 1))])
+    return graph
+
+
+class TestAStar(unittest.TestCase):
+
+    def assertShortest(self, graph: Graph, heuristic):
+        for source in graph.vertices:
+            dist, _ = dijkstra(graph, source)
+            for target in graph.vertices:
+                length, path = astar(graph, source, target, heuristic)
+                self.assertEqual(length, dist.get(target, math.inf))
+                if path:
+                    self.assertIs(path[0], source)
+                    self.assertIs(path[-1], target)
+                    self.assertEqual(path_weight(graph, path), length)
+                else:
+                    self.assertNotIn(target, dist)
+
+    def test_coordinates(self):
+        graph = grid(4, 3)
+
+        for heuristic in (euclidean_distance, manhattan_distance):
+            with self.subTest(heuristic=heuristic.__name__):
+                self.assertShortest(graph, heuristic)
+
+    def test_landmarks(self):
+        for directed in (True, False):
+            graph = road_graph(directed)
+            for landmarks in (1, 3, graph.vertices[3:5]):
+                with self.subTest(directed=directed, landmarks=landmarks):
+                    self.assertShortest(graph, LandmarkHeuristic(graph, landmarks))
+
+    def test_landmarks_bound_from_below(self):
+        graph = road_graph(True)
+        heuristic = LandmarkHeuristic(graph, 3)
+
+        for source in graph.vertices:
+            dist, _ = dijkstra(graph, source)
+            for target, d in dist.items():
+                self.assertLessEqual(heuristic(source, target), d)
+
+    def test_landmarks_prune_unreachable_directed(self):
+        graph = road_graph(True)
+        a, b, c, d, e, f, g = graph.vertices
+        heuristic = LandmarkHeuristic(graph, [a, f])
+
+        # a reaches b but not g, so b does not reach g
+        self.assertEqual(heuristic(b, g), math.inf)
+        # d reaches f but g does not, so g does not reach d
+        self.assertEqual(heuristic(g, d), math.inf)
+        self.assertEqual(heuristic(b, d), 5)
+        self.assertEqual(astar(graph, b, g, heuristic), (math.inf, []))
+
+    def test_haversine_distance(self):
+        graph = Graph(n=2)
+        amsterdam, rotterdam = graph.vertices
+        amsterdam.pos, rotterdam.pos = (52.3676, 4.9041), (51.9244, 4.4777)
+
+        self.assertAlmostEqual(haversine_distance(amsterdam, rotterdam), 57.5, delta=0.5)
+        self.assertEqual(haversine_distance(amsterdam, amsterdam), 0)
+
+
+class TestSPFA(unittest.TestCase):
+
+    def assertClosedNegativeCycle(self, cycle: list):
+        self.assertTrue(cycle)
+
+        def closes_at(start) -> bool:
+            v = start
+            for edge in cycle:
+                if v is not edge.tail and v is not edge.head:
+                    return False
+                v = edge.other_end(v)
+            return v is start
+
+        self.assertTrue(closes_at(cycle[0].tail) or closes_at(cycle[0].head))
+        self.assertLess(sum(edge.weight for edge in cycle), 0)
+
+    def test_matches_dijkstra(self):
+        for directed in (True, False):
+            graph = road_graph(directed)
+            with self.subTest(directed=directed):
+                dist, in_edge, cycle = spfa(graph, graph.vertices[0])
+                self.assertIsNone(cycle)
+                self.assertEqual((dist, in_edge), dijkstra(graph, graph.vertices[0]))
+
+    def test_negative_weights(self):
+        graph = Graph(directed=True, n=4)
+        graph.add_edges_from([(0, 1, 4), (0, 2, 1), (1, 3, -3), (2, 3, 2)])
+        a, b, c, d = graph.vertices
+
+        dist, in_edge, cycle = spfa(graph, a)
+
+        self.assertIsNone(cycle)
+        self.assertEqual(dist, {a: 0, b: 4, c: 1, d: 1})
+        self.assertIs(in_edge[d].tail, b)
+
+    def test_unreachable(self):
+        graph = road_graph(True)
+        g = graph.vertices[6]
+
+        dist, in_edge, cycle = spfa(graph, graph.vertices[0])
+
+        self.assertIsNone(cycle)
+        self.assertEqual(dist.get(g, math.inf), math.inf)
+        self.assertNotIn(g, in_edge)
+
+    def test_directed_negative_cycle(self):
+        graph = Graph(directed=True, n=5)
+        graph.add_edges_from([(0, 1, 1), (1, 2, 2), (2, 3, -4), (3, 1, 1), (3, 4, 1)])
+
+        dist, in_edge, cycle = spfa(graph, graph.vertices[0])
+
+        self.assertClosedNegativeCycle(cycle)
+        self.assertEqual({edge.tail.label for edge in cycle}, {1, 2, 3})
+        for edge, next_edge in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertIs(edge.head, next_edge.tail)
+
+    def test_undirected_negative_edge(self):
+        graph = Graph(n=3)
+        graph.add_edges_from([(0, 1, 2), (1, 2, -1)])
+
+        dist, in_edge, cycle = spfa(graph, graph.vertices[0])
+
+        self.assertClosedNegativeCycle(cycle)
+
+    def test_unreachable_negative_cycle(self):
+        graph = Graph(directed=True, n=4)
+        graph.add_edges_from([(0, 1, 1), (2, 3, -2), (3, 2, 1)])
+        a, b, c, d = graph.vertices
+
+        self.assertEqual(spfa(graph, a), ({a: 0, b: 1}, {b: graph.edges[0]}, None))
+
+
+class TestCSRSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph(directed=True, n=4)
+        self.graph.add_edges_from([(0, 1, 2), (1, 2, 1), (0, 2, 9), (2, 3, 1)])
+
+    def test_dijkstra_csr_matches_dijkstra(self):
+        dist, _ = dijkstra(self.graph, self.graph.vertices[0])
+
+        csr_dist, predecessor = dijkstra_csr(self.graph.freeze(), 0)
+
+        self.assertEqual(csr_dist, [dist[vertex] for vertex in self.graph.vertices])
+        self.assertEqual(predecessor, [-1, 0, 1, 2])
+
+    def test_dijkstra_csr_stops_at_target(self):
+        dist, predecessor = dijkstra_csr(self.graph.freeze(), 0, targets=1)
+
+        self.assertEqual(dist[:2], [0, 2])
+        self.assertEqual(dist[3], math.inf)
+        self.assertEqual(predecessor[3], -1)
+
+    def test_dijkstra_csr_without_edges(self):
+        dist, predecessor = dijkstra_csr(Graph(n=2).freeze(), 0)
+
+        self.assertEqual(dist, [0, math.inf])
+        self.assertEqual(predecessor, [-1, -1])
+
+    def test_bfs_csr(self):
+        hops, predecessor = bfs_csr(self.graph.freeze(), 0)
+
+        self.assertEqual(hops, [0, 1, 1, 2])
+        self.assertEqual(predecessor, [-1, 0, 0, 2])
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class TestBellmanFordVectorized(unittest.TestCase):
+
+    def test_missing_weight_raises(self):
+        graph = Graph(directed=True, n=3)
+        graph.add_edges_from([(0, 1, None), (1, 2, 1)])
+
+        with self.assertRaises(ValueError):
+            bellman_ford_vectorized(graph, graph.vertices[0])
+        with self.assertRaises(ValueError):
+            bellman_ford_vectorized(graph.freeze(), 0)
+
+    def test_without_edges(self):
+        graph = Graph(directed=True, n=2)
+
+        for arcs in (graph, graph.freeze()):
+            dist, predecessor, negative_cycle = bellman_ford_vectorized(arcs, 0 if arcs is not graph else
+                                                                        graph.vertices[0])
+            self.assertEqual(list(dist), [0, math.inf])
+            self.assertEqual(list(predecessor), [-1, -1])
+            self.assertFalse(negative_cycle)
+
+    def test_view(self):
+        graph = Graph(directed=True, n=3)
+        graph.add_edges_from([(0, 1, 2), (1, 2, 1), (0, 2, 9)])
+
+        dist, predecessor, negative_cycle = bellman_ford_vectorized(EdgeFilterView(graph, max_weight=5),
+                                                                    graph.vertices[0])
+
+        self.assertEqual(list(dist), [0, 2, 3])
+        self.assertEqual(list(predecessor), [-1, 0, 1])
+        self.assertFalse(negative_cycle)
+
+
+if __name__ == '__main__':
+    unittest.main()
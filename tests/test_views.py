@@ -0,0 +1,26 @@
+import unittest
+
+from graph.graph import Graph
+from graph.views import EdgeFilterView
+
+
+class TestEdgeFilterView(unittest.TestCase):
+
+    def test_weight_bounds_leave_out_unweighted_edges(self):
+        graph = Graph(n=3)
+        graph.add_edges_from([(0, 1), (1, 2, 4)])
+
+        view = EdgeFilterView(graph, max_weight=5)
+
+        self.assertEqual([edge.weight for edge in view.edges], [4])
+        self.assertEqual(len(EdgeFilterView(graph, min_weight=5).edges), 0)
+
+    def test_unbounded_view_keeps_unweighted_edges(self):
+        graph = Graph(n=3)
+        graph.add_edges_from([(0, 1), (1, 2, 4)])
+
+        self.assertEqual(len(EdgeFilterView(graph).edges), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()